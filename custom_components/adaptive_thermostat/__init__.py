@@ -3,20 +3,69 @@
 import logging
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.debounce import Debouncer
 
 # Import constants from const.py
 from .const import DOMAIN, PLATFORMS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Reconfigure bursts within this window collapse into one trailing reload
+RELOAD_COOLDOWN_SECONDS = 30.0
+
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Adaptive Thermostat integration."""
     domain_data = hass.data.setdefault(DOMAIN, {})
     domain_data.setdefault("entities", {})
     domain_data.setdefault("entry_to_entity_id", {})
+    domain_data.setdefault("reload_debouncers", {})
+
+    # Services are domain-wide, so they are registered once here rather than per entry
+    async def reset_manual_override_service(call: ServiceCall) -> None:
+        """Service to reset manual override for a thermostat."""
+        entity_id = call.data.get("entity_id")
+
+        climate_entity = domain_data["entities"].get(entity_id)
+        if climate_entity and hasattr(climate_entity, "reset_manual_override"):
+            climate_entity.reset_manual_override()
+            _LOGGER.info("Reset manual override for %s", entity_id)
+            return
+
+        _LOGGER.warning("Could not find adaptive thermostat entity: %s", entity_id)
+
+    hass.services.async_register(
+        DOMAIN,
+        "reset_manual_override",
+        reset_manual_override_service,
+        schema=vol.Schema({
+            vol.Required("entity_id"): cv.entity_id,
+        }),
+    )
+
+    async def dismiss_window_alert_service(call: ServiceCall) -> None:
+        """Service to dismiss a window alert for a thermostat."""
+        entity_id = call.data.get("entity_id")
+
+        climate_entity = domain_data["entities"].get(entity_id)
+        if climate_entity and hasattr(climate_entity, "dismiss_window_alert"):
+            climate_entity.dismiss_window_alert()
+            _LOGGER.info("Dismissed window alert for %s", entity_id)
+            return
+
+        _LOGGER.warning("Could not find adaptive thermostat entity: %s", entity_id)
+
+    hass.services.async_register(
+        DOMAIN,
+        "dismiss_window_alert",
+        dismiss_window_alert_service,
+        schema=vol.Schema({
+            vol.Required("entity_id"): cv.entity_id,
+        }),
+    )
+
     # No Lovelace registration attempt here anymore.
     # Rely on manifest.json and HACS for card availability,
     # and manual user addition if necessary.
@@ -25,60 +74,13 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Adaptive Thermostat from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
-
     _LOGGER.info("Setting up Adaptive Thermostat entry %s", entry.entry_id)
 
-    # Forward the setup to the climate platform.
+    # Forward the setup to the climate platform. This must stay awaited: Home
+    # Assistant rejects platform forwards scheduled after setup returns, and
+    # the sensor platforms bind to the climate entity registered here.
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Register services if not already registered
-    if not hass.services.has_service(DOMAIN, "reset_manual_override"):
-        async def reset_manual_override_service(call: ServiceCall) -> None:
-            """Service to reset manual override for a thermostat."""
-            entity_id = call.data.get("entity_id")
-
-            climate_entities = hass.data.get(DOMAIN, {}).get("entities", {})
-            climate_entity = climate_entities.get(entity_id)
-            if climate_entity and hasattr(climate_entity, "reset_manual_override"):
-                climate_entity.reset_manual_override()
-                _LOGGER.info("Reset manual override for %s", entity_id)
-                return
-
-            _LOGGER.warning("Could not find adaptive thermostat entity: %s", entity_id)
-
-        hass.services.async_register(
-            DOMAIN,
-            "reset_manual_override",
-            reset_manual_override_service,
-            schema=vol.Schema({
-                vol.Required("entity_id"): cv.entity_id,
-            }),
-        )
-
-    if not hass.services.has_service(DOMAIN, "dismiss_window_alert"):
-        async def dismiss_window_alert_service(call: ServiceCall) -> None:
-            """Service to dismiss a window alert for a thermostat."""
-            entity_id = call.data.get("entity_id")
-
-            climate_entities = hass.data.get(DOMAIN, {}).get("entities", {})
-            climate_entity = climate_entities.get(entity_id)
-            if climate_entity and hasattr(climate_entity, "dismiss_window_alert"):
-                climate_entity.dismiss_window_alert()
-                _LOGGER.info("Dismissed window alert for %s", entity_id)
-                return
-
-            _LOGGER.warning("Could not find adaptive thermostat entity: %s", entity_id)
-
-        hass.services.async_register(
-            DOMAIN,
-            "dismiss_window_alert",
-            dismiss_window_alert_service,
-            schema=vol.Schema({
-                vol.Required("entity_id"): cv.entity_id,
-            }),
-        )
-
     # Listen for options updates.
     entry.async_on_unload(entry.add_update_listener(async_update_options))
 
@@ -101,10 +103,34 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
 async def async_update_options(hass: HomeAssistant, entry: ConfigEntry):
     """Handle options update."""
-    _LOGGER.debug("Options updated for %s, reloading entry", entry.entry_id)
-    await hass.config_entries.async_reload(entry.entry_id)
-    _LOGGER.warning( # Use WARNING level initially for high visibility in logs
-        "Adaptive Thermostat configuration options updated for %s. Reloading integration.",
+    _LOGGER.info(
+        "Adaptive Thermostat configuration updated for %s, scheduling reload",
         entry.title,
     )
-    # Reload the config entry, triggering async_unload_entry and async_setup_entry
+    # The debouncer outlives the reloads it triggers, so it is kept per entry
+    # in hass.data rather than on the entry runtime
+    debouncers = hass.data[DOMAIN]["reload_debouncers"]
+    debouncer = debouncers.get(entry.entry_id)
+    if debouncer is None:
+        @callback
+        def _schedule_reload() -> None:
+            # Schedule instead of awaiting: cancels a pending setup retry and
+            # never races an in-progress setup of the same entry
+            hass.config_entries.async_schedule_reload(entry.entry_id)
+
+        debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=RELOAD_COOLDOWN_SECONDS,
+            immediate=True,
+            function=_schedule_reload,
+        )
+        debouncers[entry.entry_id] = debouncer
+    await debouncer.async_call()
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Drop per-entry helpers when an entry is deleted."""
+    debouncer = hass.data.get(DOMAIN, {}).get("reload_debouncers", {}).pop(entry.entry_id, None)
+    if debouncer is not None:
+        debouncer.async_cancel()
@@ -11,9 +11,8 @@ from homeassistant.const import CONF_NAME
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
-from homeassistant.helpers.event import Event, async_track_state_change_event  # type: ignore
 
-from .const import DOMAIN, SIGNAL_THERMOSTAT_READY
+from .const import DOMAIN, SIGNAL_HEATER_STATE, SIGNAL_THERMOSTAT_READY
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -45,27 +44,33 @@ class AdaptiveThermostatHeaterBinarySensor(BinarySensorEntity):
         )
         self._attr_is_on = False
         self._attr_available = False
-        self._attr_extra_state_attributes: dict[str, Any] = {}
+        # Updated in place on every climate state event
+        self._attr_extra_state_attributes: dict[str, Any] = {
+            "linked_entity_id": None,
+            "hvac_mode": None,
+            "hvac_action": None,
+            "zone_heater_on": False,
+        }
         self._climate_entity_id: Optional[str] = None
-        self._unsub_dispatcher: Optional[Callable[[], None]] = None
+        # Created by async_setup before any entry is set up
+        self._entry_map: dict[str, str] = hass.data[DOMAIN]["entry_to_entity_id"]
         self._unsub_state: Optional[Callable[[], None]] = None
 
     async def async_added_to_hass(self) -> None:
         """Run when the binary sensor is added to Home Assistant."""
         await super().async_added_to_hass()
         signal = f"{SIGNAL_THERMOSTAT_READY}_{self._entry.entry_id}"
-        self._unsub_dispatcher = async_dispatcher_connect(
-            self.hass,
-            signal,
-            self._handle_thermostat_ready,
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                signal,
+                self._handle_thermostat_ready,
+            )
         )
         self._try_bind_existing_thermostat()
 
     async def async_will_remove_from_hass(self) -> None:
         """Cleanup when the binary sensor is removed."""
-        if self._unsub_dispatcher:
-            self._unsub_dispatcher()
-            self._unsub_dispatcher = None
         if self._unsub_state:
             self._unsub_state()
             self._unsub_state = None
@@ -73,9 +78,7 @@ class AdaptiveThermostatHeaterBinarySensor(BinarySensorEntity):
 
     def _try_bind_existing_thermostat(self) -> None:
         """Attempt to bind immediately if the climate entity is already registered."""
-        domain_data = self.hass.data.get(DOMAIN, {})
-        entry_map = domain_data.get("entry_to_entity_id") or {}
-        entity_id = entry_map.get(self._entry.entry_id)
+        entity_id = self._entry_map.get(self._entry.entry_id)
         if entity_id:
             self._set_climate_entity(entity_id)
 
@@ -102,7 +105,7 @@ class AdaptiveThermostatHeaterBinarySensor(BinarySensorEntity):
             )
             self._attr_available = False
             self._attr_is_on = False
-            self._attr_extra_state_attributes = {}
+            self._reset_attributes()
             self.async_write_ha_state()
             return
 
@@ -112,20 +115,45 @@ class AdaptiveThermostatHeaterBinarySensor(BinarySensorEntity):
             entity_id,
         )
         self._attr_available = True
-        self._unsub_state = async_track_state_change_event(
+        # The thermostat signals heater transitions directly, so temperature
+        # and diagnostic updates on the climate entity never reach us
+        self._unsub_state = async_dispatcher_connect(
             self.hass,
-            [entity_id],
-            self._handle_climate_state_event,
+            f"{SIGNAL_HEATER_STATE}_{self._entry.entry_id}",
+            self._handle_heater_state,
         )
         state = self.hass.states.get(entity_id)
         self._update_from_state(state)
         self.async_write_ha_state()
 
     @callback
-    def _handle_climate_state_event(self, event: Event) -> None:
-        """Handle a state change from the linked climate entity."""
-        new_state = event.data.get("new_state")
-        self._update_from_state(new_state)
+    def _handle_heater_state(
+        self,
+        hvac_mode: Optional[str],
+        hvac_action: Optional[str],
+        zone_heater_on: bool,
+    ) -> None:
+        """Handle a heater state change signalled by the linked thermostat."""
+        if hvac_mode is None:
+            # The thermostat is being removed
+            if not self._attr_available:
+                return
+            self._attr_available = False
+            self._attr_is_on = False
+            self._reset_attributes()
+            self.async_write_ha_state()
+            return
+
+        attrs = self._attr_extra_state_attributes
+        if (
+            self._attr_available
+            and self._attr_is_on == zone_heater_on
+            and attrs["hvac_mode"] == hvac_mode
+            and attrs["hvac_action"] == hvac_action
+        ):
+            return
+        self._attr_available = True
+        self._apply_heater_state(hvac_mode, hvac_action, zone_heater_on)
         self.async_write_ha_state()
 
     def _update_from_state(self, state: Optional[Any]) -> None:
@@ -133,22 +161,37 @@ class AdaptiveThermostatHeaterBinarySensor(BinarySensorEntity):
         if state is None:
             self._attr_available = False
             self._attr_is_on = False
-            self._attr_extra_state_attributes = {}
+            self._reset_attributes()
             return
 
         self._attr_available = True
-        attrs = state.attributes or {}
+        attrs = state.attributes
         hvac_action = attrs.get("hvac_action")
 
         zone_heater_on = attrs.get("zone_heater_on")
         if zone_heater_on is None:
             zone_heater_on = hvac_action in ("heating", "heat")
 
-        is_on = bool(zone_heater_on)
+        self._apply_heater_state(state.state, hvac_action, bool(zone_heater_on))
+
+    def _apply_heater_state(
+        self,
+        hvac_mode: Optional[str],
+        hvac_action: Optional[str],
+        is_on: bool,
+    ) -> None:
+        """Store the heater state and mirror it into the attributes."""
         self._attr_is_on = is_on
-        self._attr_extra_state_attributes = {
-            "linked_entity_id": getattr(state, "entity_id", None),
-            "hvac_mode": state.state,
-            "hvac_action": hvac_action,
-            "zone_heater_on": is_on,
-        }
+        attrs_out = self._attr_extra_state_attributes
+        attrs_out["linked_entity_id"] = self._climate_entity_id
+        attrs_out["hvac_mode"] = hvac_mode
+        attrs_out["hvac_action"] = hvac_action
+        attrs_out["zone_heater_on"] = is_on
+
+    def _reset_attributes(self) -> None:
+        """Clear the linked thermostat attributes without reallocating."""
+        attrs_out = self._attr_extra_state_attributes
+        attrs_out["linked_entity_id"] = None
+        attrs_out["hvac_mode"] = None
+        attrs_out["hvac_action"] = None
+        attrs_out["zone_heater_on"] = False
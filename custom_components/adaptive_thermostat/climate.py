@@ -4,7 +4,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
+from bisect import bisect_left
 from collections import deque
+from itertools import islice
 from datetime import datetime, timedelta
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
@@ -18,10 +21,13 @@ from homeassistant.const import (  # type: ignore
     ATTR_TEMPERATURE,
     CONF_NAME,
     STATE_ON,
+    STATE_UNAVAILABLE,
+    STATE_UNKNOWN,
     UnitOfTemperature,
 )
 from homeassistant.config_entries import ConfigEntry  # type: ignore
 from homeassistant.core import HomeAssistant, callback  # type: ignore
+from homeassistant.helpers.debounce import Debouncer  # type: ignore
 from homeassistant.helpers.device_registry import DeviceInfo  # type: ignore
 from homeassistant.helpers.dispatcher import async_dispatcher_send  # type: ignore
 from homeassistant.helpers.entity_platform import AddEntitiesCallback  # type: ignore
@@ -64,11 +70,12 @@ from .const import (
     DEFAULT_WINDOW_SLOPE_THRESHOLD,
     MAX_TARGET_TEMP,
     MIN_TARGET_TEMP,
+    SIGNAL_HEATER_STATE,
     SIGNAL_THERMOSTAT_READY,
     STORAGE_STATE_KEY,
     STORAGE_VERSION,
 )
-from .thermal_controller import ThermalController
+from .thermal_controller import Params, ThermalController
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -83,6 +90,8 @@ THERMAL_SAMPLE_HISTORY_SECONDS = 6 * 3600.0  # retain up to 6 hours of samples f
 WINDOW_CONFIRMATION_SECONDS = 120.0  # seconds window slope must persist before auto-confirm
 WINDOW_CONFIRMATION_DROP = 0.15  # °C additional drop required to confirm immediately
 WINDOW_CANDIDATE_RESET_SECONDS = 240.0  # seconds before discarding an unconfirmed candidate
+WINDOW_CONFIRM_SLOPE_FACTOR = 0.5  # fraction of the drop threshold that must persist to confirm
+WINDOW_CLEAR_SLOPE_FACTOR = 0.2  # fraction of the drop threshold below which a candidate clears
 WINDOW_FALSE_POSITIVE_TOLERANCE = 0.1  # °C slack to auto-clear noisy detections
 WINDOW_RECOVERY_POSITIVE_SLOPE_THRESHOLD = 0.2  # °C/h slope to mark recovery start
 WINDOW_RECOVERY_STABLE_SLOPE_THRESHOLD = 2.5  # °C/h slope to resume heating
@@ -103,6 +112,10 @@ CYCLE_RESIDUAL_SLOPE_THRESHOLD = -0.00005  # °C/s; below this treats tail as co
 CYCLE_TARGET_TIME_GRACE = 120.0  # seconds grace beyond predicted peak time
 VALVE_OPEN_TIMEOUT_SECONDS = 60.0
 VALVE_OPEN_POLL_SECONDS = 2.0
+STATE_CHANGE_DEBOUNCE_SECONDS = 1.0
+ISO_CACHE_MAX_ENTRIES = 32
+
+_INVALID_STATES = frozenset({STATE_UNKNOWN, STATE_UNAVAILABLE})
 
 
 def _clamp(value: float, low: float, high: float) -> float:
@@ -110,6 +123,63 @@ def _clamp(value: float, low: float, high: float) -> float:
     return max(low, min(high, value))
 
 
+def _least_squares_slope(xs: List[float], ys: List[float]) -> float:
+    """Return the least-squares slope of ys over xs, or 0.0 if undefined."""
+    count = len(xs)
+    if count < 2:
+        return 0.0
+    mean_x = sum(xs) / count
+    mean_y = sum(ys) / count
+    sxx = 0.0
+    sxy = 0.0
+    for x, y in zip(xs, ys):
+        dx = x - mean_x
+        sxx += dx * dx
+        sxy += dx * (y - mean_y)
+    if sxx <= 0.0:
+        return 0.0
+    return sxy / sxx
+
+
+class _WindowCandidate:
+    """Suspected open-window event awaiting confirmation, reused in place."""
+
+    __slots__ = (
+        "start_ts",
+        "start_temp",
+        "last_temp",
+        "start_measurement_ts",
+        "last_measurement_ts",
+        "sample_count",
+        "active",
+    )
+
+    def __init__(self) -> None:
+        self.start_ts = 0.0
+        self.start_temp: Optional[float] = None
+        self.last_temp: Optional[float] = None
+        self.start_measurement_ts: Optional[float] = None
+        self.last_measurement_ts: Optional[float] = None
+        self.sample_count = 0
+        self.active = False
+
+    def start(
+        self,
+        now_ts: float,
+        start_temp: Optional[float],
+        last_temp: Optional[float],
+        measurement_ts: Optional[float],
+    ) -> None:
+        """Begin tracking a new candidate."""
+        self.start_ts = now_ts
+        self.start_temp = start_temp
+        self.last_temp = last_temp
+        self.start_measurement_ts = measurement_ts
+        self.last_measurement_ts = measurement_ts
+        self.sample_count = 1
+        self.active = True
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: ConfigEntry,
@@ -125,8 +195,10 @@ class AdaptiveThermostat(ClimateEntity):
 
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         """Initialize the thermostat."""
-        self._hass = hass
         self._entry_id = entry.entry_id
+        # Bound once: state reads and service calls run on every update tick
+        self._states_get = hass.states.get
+        self._services_call = hass.services.async_call
         self._attr_unique_id = entry.entry_id
 
         config = {**entry.data, **entry.options}
@@ -160,6 +232,39 @@ class AdaptiveThermostat(ClimateEntity):
         self._backup_outdoor_sensor_entity_id = get_entity_id(CONF_BACKUP_OUTDOOR_SENSOR)
         self._central_heater_entity_id = get_entity_id(CONF_CENTRAL_HEATER)
 
+        # Per-sensor event handlers. Humidity and motion are diagnostics only and
+        # are applied inline; everything else needs a control pass.
+        handlers: List[Tuple[Optional[str], Callable[[Event], None]]] = [
+            (self._temp_sensor_entity_id, self._async_request_update),
+            (self._humidity_sensor_entity_id, self._async_humidity_changed),
+            (self._outdoor_sensor_entity_id, self._async_request_update),
+            (self._backup_outdoor_sensor_entity_id, self._async_request_update),
+            (self._door_window_sensor_entity_id, self._async_request_update),
+            (self._motion_sensor_entity_id, self._async_motion_changed),
+        ]
+        self._entity_handlers: Dict[str, Callable[[Event], None]] = {
+            entity_id: handler for entity_id, handler in handlers if entity_id
+        }
+        self._tracked_entity_ids: Tuple[str, ...] = tuple(self._entity_handlers)
+
+        # Domains of the controlled entities, resolved once for service dispatch
+        self._entity_domains: Dict[str, str] = {
+            entity_id: entity_id.split(".", 1)[0]
+            for entity_id in [*self._heater_entity_ids, self._central_heater_entity_id]
+            if entity_id and "." in entity_id
+        }
+        # (domain, service) used to switch each controlled entity, resolved once
+        controlled = [e for e in (*self._heater_entity_ids, self._central_heater_entity_id) if e]
+        self._turn_on_services: Dict[str, Tuple[str, str]] = {
+            entity_id: self._resolve_domain_and_service(entity_id, True) for entity_id in controlled
+        }
+        self._turn_off_services: Dict[str, Tuple[str, str]] = {
+            entity_id: self._resolve_domain_and_service(entity_id, False) for entity_id in controlled
+        }
+        # Zone heaters grouped per service so each group is switched in one call
+        self._heater_on_groups = self._group_by_service(self._heater_entity_ids, True)
+        self._heater_off_groups = self._group_by_service(self._heater_entity_ids, False)
+
         # Timing configuration
         self._min_on_time = 0.0
         self._min_off_time = 0.0
@@ -192,7 +297,6 @@ class AdaptiveThermostat(ClimateEntity):
 
         # Climate state
         self._current_temperature: Optional[float] = None
-        self._filtered_temperature: Optional[float] = None
         self._current_humidity: Optional[float] = None
         self._target_temperature: float = self._presets["home"]
         self._current_preset: str | None = "home"
@@ -226,14 +330,18 @@ class AdaptiveThermostat(ClimateEntity):
         self._raw_temperature_slope: float = 0.0
         self._display_temperature_slope: float = 0.0
         self._hourly_temperature_slope: float = 0.0
-        self._temperature_history: deque[Tuple[float, float]] = deque()
+        # Hourly temperature history as parallel, time-ordered columns
+        self._history_ts: deque[float] = deque()
+        self._history_temp: deque[float] = deque()
 
         # Window detection
         self._open_window_detected: bool = False
         self._last_window_event_ts: Optional[float] = None
         self._window_alert: Optional[str] = None
         self._open_window_baseline_temp: Optional[float] = None
-        self._window_candidate: Optional[Dict[str, Any]] = None
+        self._window_candidate = _WindowCandidate()
+        # Measurement last evaluated with nothing pending (no candidate or window)
+        self._last_window_eval_ts: Optional[float] = None
         self._window_recovery_start_ts: Optional[float] = None
         self._window_recovery_peak_slope: Optional[float] = None
         self._post_window_dampen_cycles: int = 0
@@ -242,6 +350,13 @@ class AdaptiveThermostat(ClimateEntity):
         # Outdoor tracking
         self._current_outdoor_temp: Optional[float] = None
         self._last_outdoor_temp: Optional[float] = None
+        # entity_id -> (state.last_updated, parsed value) for every numeric sensor
+        self._numeric_cache: Dict[str, Tuple[datetime, Optional[float]]] = {}
+        # Formatted timestamps exposed as attributes; inputs change rarely
+        self._iso_cache: Dict[float, str] = {}
+        # Rounded thermal params exposed as an attribute, and the Params they came from
+        self._thermal_params_source: Optional[Params] = None
+        self._thermal_params_payload: Dict[str, float] = {}
 
         # Control bookkeeping
         self._last_update_ts: Optional[float] = None
@@ -250,6 +365,20 @@ class AdaptiveThermostat(ClimateEntity):
         self._delayed_valve_off_task: Optional[asyncio.Task] = None
         self._control_tick_unsub = None
         self._remove_listener = None
+        self._remove_heater_listener = None
+        # Sensors often report in bursts; run one control pass per burst
+        self._update_debouncer = Debouncer(
+            hass,
+            _LOGGER,
+            cooldown=STATE_CHANGE_DEBOUNCE_SECONDS,
+            immediate=True,
+            function=self._async_update_and_write,
+        )
+        # Every caller (tick, debouncer, its trailing timer) goes through
+        # _async_update_and_write, which records triggers arriving mid-pass
+        # and replays them once the running pass finishes
+        self._update_in_progress: bool = False
+        self._update_rerun: bool = False
         self._valve_error: Optional[str] = None
         self._valve_error_at: Optional[float] = None
 
@@ -257,11 +386,16 @@ class AdaptiveThermostat(ClimateEntity):
         self._state_store: Store | None = None
         self._state_cache_ref: Dict[str, Any] | None = None
         self._state_dirty: bool = False
-        self._state_save_unsub = None
+
+        # Last state handed to Home Assistant, used to skip no-op writes
+        self._last_written_snapshot: Optional[Tuple[Any, ...]] = None
+        self._last_heater_signal: Optional[Tuple[Any, ...]] = None
+        self._write_scheduled: bool = False
 
         # Home Assistant metadata
         self._attr_temperature_unit = hass.config.units.temperature_unit or UnitOfTemperature.CELSIUS
         self._attr_hvac_modes = [HVACMode.OFF, HVACMode.HEAT]
+        self._attr_preset_modes = list(self._presets)  # preset names never change
         self._attr_supported_features = ClimateEntityFeature.TARGET_TEMPERATURE | ClimateEntityFeature.PRESET_MODE
 
         self._attr_extra_state_attributes: Dict[str, Any] = {
@@ -303,6 +437,31 @@ class AdaptiveThermostat(ClimateEntity):
             "min_on_s": self._thermal_controller.min_on_s,
             "min_off_s": self._thermal_controller.min_off_s,
             "min_on_override_s": self._thermal_controller.get_min_on_override(),
+            # Keys written later by the control tick and cycle evaluation; declared
+            # up front so the dict is sized once and later writes only overwrite
+            "heater_states": None,
+            "central_heater_state": None,
+            "current_temperature": None,
+            "filtered_temperature": None,
+            "current_humidity": None,
+            "current_outdoor_temp": None,
+            "effective_control_temperature": None,
+            "temperature_slope_instant_per_hour": None,
+            "temperature_slope_per_hour": None,
+            "raw_temperature_slope_per_hour": None,
+            "heat_on_threshold": None,
+            "heat_off_threshold": None,
+            "last_window_event": None,
+            "door_window_open": None,
+            "motion_active": None,
+            "last_updated": None,
+            "last_cycle_ratio": None,
+            "last_cycle_peak_predicted": None,
+            "last_cycle_peak_actual": None,
+            "last_cycle_tau_on": None,
+            "last_cycle_overshoot": None,
+            "last_cycle_undershoot": None,
+            "last_cycle_observed_at": None,
         }
 
     @property
@@ -344,11 +503,6 @@ class AdaptiveThermostat(ClimateEntity):
         """Return current humidity."""
         return self._current_humidity
 
-    @property
-    def preset_modes(self) -> Optional[List[str]]:
-        """Return available preset modes."""
-        return list(self._presets.keys())
-
     @property
     def preset_mode(self) -> Optional[str]:
         """Return current preset mode."""
@@ -391,31 +545,32 @@ class AdaptiveThermostat(ClimateEntity):
 
         if self.entity_id:
             entities[self.entity_id] = self
+        if self._central_heater_entity_id:
+            # Zones sharing a central heater, for the turn-off sibling check
+            domain_data.setdefault("central_heater_zones", {}).setdefault(
+                self._central_heater_entity_id, set()
+            ).add(self)
 
         await self._async_load_runtime_state()
 
         # Register listeners
-        entities_to_track = [
-            entity_id
-            for entity_id in [
-                self._temp_sensor_entity_id,
-                self._humidity_sensor_entity_id,
-                self._outdoor_sensor_entity_id,
-                self._backup_outdoor_sensor_entity_id,
-                self._door_window_sensor_entity_id,
-                self._motion_sensor_entity_id,
-            ]
-            if entity_id
-        ]
-        entities_to_track.extend(self._heater_entity_ids)
-
-        if entities_to_track:
+        if self._tracked_entity_ids:
             self._remove_listener = async_track_state_change_event(
                 self.hass,
-                entities_to_track,
+                self._tracked_entity_ids,
                 self._async_state_changed,
             )
 
+        # Valve changes only affect diagnostics; they never drive control, and
+        # the heater_states attribute is refreshed from these events alone
+        self._attr_extra_state_attributes["heater_states"] = self._gather_heater_states()
+        if self._heater_entity_ids:
+            self._remove_heater_listener = async_track_state_change_event(
+                self.hass,
+                self._heater_entity_ids,
+                self._async_heater_changed,
+            )
+
         self._control_tick_unsub = async_track_time_interval(
             self.hass, self._async_control_tick, timedelta(seconds=CONTROL_TICK_SECONDS)
         )
@@ -436,6 +591,12 @@ class AdaptiveThermostat(ClimateEntity):
             self._remove_listener()
             self._remove_listener = None
 
+        if self._remove_heater_listener:
+            self._remove_heater_listener()
+            self._remove_heater_listener = None
+
+        self._update_debouncer.async_cancel()
+
         if self._central_heater_task:
             self._central_heater_task.cancel()
             self._central_heater_task = None
@@ -448,9 +609,6 @@ class AdaptiveThermostat(ClimateEntity):
             self._planned_off_unsub()
             self._planned_off_unsub = None
 
-        if self._state_save_unsub:
-            self._state_save_unsub()
-            self._state_save_unsub = None
         if self._state_dirty:
             await self._async_persist_runtime_state()
 
@@ -459,6 +617,19 @@ class AdaptiveThermostat(ClimateEntity):
         if self.entity_id in entities:
             entities.pop(self.entity_id, None)
 
+        central_zones = domain_data.get("central_heater_zones", {})
+        siblings = central_zones.get(self._central_heater_entity_id)
+        if siblings is not None:
+            siblings.discard(self)
+            if not siblings:
+                central_zones.pop(self._central_heater_entity_id, None)
+
+        # A None mode tells the heater binary sensor the thermostat is gone
+        self._last_heater_signal = None
+        async_dispatcher_send(
+            self.hass, f"{SIGNAL_HEATER_STATE}_{self._entry_id}", None, None, False
+        )
+
         entry_map = domain_data.get("entry_to_entity_id", {})
         if self._entry_id in entry_map:
             entry_map.pop(self._entry_id, None)
@@ -481,12 +652,12 @@ class AdaptiveThermostat(ClimateEntity):
             self._manual_override = False
             self._attr_extra_state_attributes["manual_override"] = False
             self._hvac_mode = HVACMode.HEAT
-            await self._async_control_heating(dt_util.utcnow().timestamp())
+            await self._async_control_heating(time.time())
         else:
             _LOGGER.warning("[%s] Unsupported HVAC mode: %s", self._entry_id, hvac_mode)
             return
         self._mark_state_dirty()
-        self.async_write_ha_state()
+        self._async_write_ha_state_if_changed()
 
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set preset mode."""
@@ -498,9 +669,9 @@ class AdaptiveThermostat(ClimateEntity):
         self._target_temperature = self._presets[preset_mode]
         self._thermal_controller.target = self._target_temperature
         if self._hvac_mode == HVACMode.HEAT:
-            await self._async_control_heating(dt_util.utcnow().timestamp())
+            await self._async_control_heating(time.time())
         self._mark_state_dirty()
-        self.async_write_ha_state()
+        self._async_write_ha_state_if_changed()
 
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Handle target temperature changes."""
@@ -516,23 +687,21 @@ class AdaptiveThermostat(ClimateEntity):
             self._current_preset = None
         self._thermal_controller.target = self._target_temperature
         if self._hvac_mode == HVACMode.HEAT:
-            await self._async_control_heating(dt_util.utcnow().timestamp())
+            await self._async_control_heating(time.time())
         self._mark_state_dirty()
-        self.async_write_ha_state()
+        self._async_write_ha_state_if_changed()
 
     async def async_update(self) -> None:
         """Fetch latest data and control the heater."""
         try:
             now = dt_util.utcnow()
-            now_ts = dt_util.as_timestamp(now)
-            dt = 0.0 if self._last_update_ts is None else max(0.0, now_ts - self._last_update_ts)
+            now_ts = now.timestamp()
 
             raw_temp, temp_ts = self._read_temperature(now_ts)
             humidity = self._read_humidity()
             outdoor_temp, backup_outdoor_temp = self._read_outdoor_temperatures()
             door_window_open = self._read_binary_sensor(self._door_window_sensor_entity_id)
             motion_active = self._read_binary_sensor(self._motion_sensor_entity_id)
-            heater_states = self._gather_heater_states()
             central_state = self._gather_central_state()
 
             if raw_temp is not None:
@@ -542,22 +711,20 @@ class AdaptiveThermostat(ClimateEntity):
             if humidity is not None:
                 self._current_humidity = humidity
 
+            effective_outdoor = outdoor_temp if outdoor_temp is not None else backup_outdoor_temp
             if outdoor_temp is not None:
                 self._current_outdoor_temp = outdoor_temp
             elif backup_outdoor_temp is not None and self._current_outdoor_temp is None:
                 self._current_outdoor_temp = backup_outdoor_temp
 
-            if outdoor_temp is not None:
-                self._thermal_controller.update_outdoor(outdoor_temp)
-            elif backup_outdoor_temp is not None:
-                self._thermal_controller.update_outdoor(backup_outdoor_temp)
+            if effective_outdoor is not None:
+                self._thermal_controller.update_outdoor(effective_outdoor)
 
             await self._async_update_window_detection(now_ts, door_window_open)
             self._update_sensor_attributes(
                 now,
                 motion_active,
                 door_window_open,
-                heater_states,
                 central_state,
             )
 
@@ -565,7 +732,7 @@ class AdaptiveThermostat(ClimateEntity):
                 if self._manual_override:
                     _LOGGER.debug("[%s] Auto on/off suppressed by manual override", self._entry_id)
                 else:
-                    await self._async_handle_auto_onoff(outdoor_temp, backup_outdoor_temp)
+                    await self._async_handle_auto_onoff(outdoor_temp, backup_outdoor_temp, now_ts)
 
             if self._hvac_mode == HVACMode.HEAT:
                 await self._async_control_heating(now_ts)
@@ -579,14 +746,9 @@ class AdaptiveThermostat(ClimateEntity):
         if not self._temp_sensor_entity_id:
             return self._current_temperature, fallback_ts
 
-        state = self.hass.states.get(self._temp_sensor_entity_id)
-        if not state or state.state in ("unknown", "unavailable"):
-            return None, None
-
-        try:
-            value = float(state.state)
-        except (ValueError, TypeError):
-            _LOGGER.warning("[%s] Invalid temperature from %s: %s", self._entry_id, self._temp_sensor_entity_id, state.state)
+        state = self._states_get(self._temp_sensor_entity_id)
+        value = self._state_float(state, "temperature")
+        if value is None:
             return None, None
 
         state_dt = getattr(state, "last_changed", None) or getattr(state, "last_updated", None)
@@ -597,21 +759,38 @@ class AdaptiveThermostat(ClimateEntity):
         """Read humidity sensor."""
         if not self._humidity_sensor_entity_id:
             return None
-        state = self.hass.states.get(self._humidity_sensor_entity_id)
-        if not state or state.state in ("unknown", "unavailable"):
+        return self._humidity_from_state(self._states_get(self._humidity_sensor_entity_id))
+
+    def _humidity_from_state(self, state: Any) -> Optional[float]:
+        """Parse a humidity sensor state."""
+        return self._state_float(state, "humidity")
+
+    def _state_float(self, state: Any, label: str) -> Optional[float]:
+        """Parse a numeric sensor state, memoized per entity until it updates."""
+        if not state or state.state in _INVALID_STATES:
             return None
+        entity_id = state.entity_id
+        cached = self._numeric_cache.get(entity_id)
+        if cached is not None and cached[0] == state.last_updated:
+            return cached[1]
         try:
-            return float(state.state)
+            value: Optional[float] = float(state.state)
         except (ValueError, TypeError):
-            _LOGGER.warning("[%s] Invalid humidity from %s: %s", self._entry_id, self._humidity_sensor_entity_id, state.state)
-            return None
+            _LOGGER.warning("[%s] Invalid %s from %s: %s", self._entry_id, label, entity_id, state.state)
+            value = None
+        self._numeric_cache[entity_id] = (state.last_updated, value)
+        return value
 
     def _read_binary_sensor(self, entity_id: Optional[str]) -> Optional[bool]:
         """Read binary sensor value as boolean."""
         if not entity_id:
             return None
-        state = self.hass.states.get(entity_id)
-        if not state or state.state in ("unknown", "unavailable"):
+        return self._binary_from_state(self._states_get(entity_id))
+
+    @staticmethod
+    def _binary_from_state(state: Any) -> Optional[bool]:
+        """Parse a binary sensor state as boolean."""
+        if not state or state.state in _INVALID_STATES:
             return None
         return state.state == STATE_ON
 
@@ -620,14 +799,7 @@ class AdaptiveThermostat(ClimateEntity):
         def safe_float(entity_id: Optional[str]) -> Optional[float]:
             if not entity_id:
                 return None
-            state = self.hass.states.get(entity_id)
-            if not state or state.state in ("unknown", "unavailable"):
-                return None
-            try:
-                return float(state.state)
-            except (ValueError, TypeError):
-                _LOGGER.warning("[%s] Invalid numeric value from %s: %s", self._entry_id, entity_id, state.state)
-                return None
+            return self._state_float(self._states_get(entity_id), "outdoor temperature")
 
         return safe_float(self._outdoor_sensor_entity_id), safe_float(self._backup_outdoor_sensor_entity_id)
 
@@ -661,42 +833,47 @@ class AdaptiveThermostat(ClimateEntity):
         self._last_measurement_temp = raw_temp
         self._raw_temperature_slope = slope
         self._display_temperature_slope = slope
-        self._filtered_temperature = raw_temp
         self._update_hourly_temperature_slope(sample_ts, raw_temp)
         self._record_thermal_sample(sample_ts, raw_temp)
 
     def _update_hourly_temperature_slope(self, sample_ts: float, temp: float) -> None:
         """Maintain a rolling history to compute long term slope."""
-        if self._temperature_history and sample_ts <= self._temperature_history[-1][0]:
-            self._temperature_history[-1] = (sample_ts, temp)
+        history_ts = self._history_ts
+        history_temp = self._history_temp
+        if history_ts and history_ts[-1] == sample_ts and history_temp[-1] == temp:
+            # Control ticks re-read an unchanged sensor with the same
+            # last_changed stamp; history and slope would come out identical
+            return
+        if history_ts and sample_ts <= history_ts[-1]:
+            history_ts[-1] = sample_ts
+            history_temp[-1] = temp
         else:
-            self._temperature_history.append((sample_ts, temp))
+            history_ts.append(sample_ts)
+            history_temp.append(temp)
 
         cutoff = sample_ts - HOURLY_SLOPE_WINDOW_SECONDS
         prune_before = sample_ts - HOURLY_HISTORY_BUFFER_SECONDS
 
-        while self._temperature_history and self._temperature_history[0][0] < prune_before:
-            self._temperature_history.popleft()
+        while history_ts and history_ts[0] < prune_before:
+            history_ts.popleft()
+            history_temp.popleft()
 
-        if not self._temperature_history:
+        if not history_ts:
             self._hourly_temperature_slope = 0.0
             return
 
-        reference_temp = self._temperature_history[0][1]
-        reference_ts = self._temperature_history[0][0]
-        for ts, temp_value in self._temperature_history:
-            if ts >= cutoff:
-                reference_temp = temp_value
-                reference_ts = ts
-                break
-
-        dt_hist = sample_ts - reference_ts
-        if dt_hist <= 0:
+        # History is time-ordered: fit over the samples inside the window
+        index = bisect_left(history_ts, cutoff)
+        reference_ts = history_ts[index]
+        if sample_ts - reference_ts <= 0:
             self._hourly_temperature_slope = 0.0
             return
 
-        slope_per_hour = (temp - reference_temp) / dt_hist * 3600.0
-        self._hourly_temperature_slope = slope_per_hour
+        # Least-squares slope: robust to sensor jitter at either end of the
+        # window, and equal to the two-point slope when only two samples exist
+        xs = [ts - reference_ts for ts in islice(history_ts, index, None)]
+        ys = list(islice(history_temp, index, None))
+        self._hourly_temperature_slope = _least_squares_slope(xs, ys) * 3600.0
 
     def _record_thermal_sample(self, sample_ts: float, temp: float) -> None:
         """Record a sample for the thermal model, respecting window quiescence."""
@@ -714,21 +891,20 @@ class AdaptiveThermostat(ClimateEntity):
 
     def _recent_heat_spike_detected(self, now_ts: float, current_temp: Optional[float]) -> bool:
         """Detect a recent temporary heat spike (oven, dryer, etc.)."""
-        if current_temp is None or not self._temperature_history:
+        if current_temp is None or not self._history_ts:
             return False
 
-        window_start = now_ts - HEAT_SPIKE_WINDOW_SECONDS
-        recent = [(ts, temp) for ts, temp in self._temperature_history if ts >= window_start]
-        if len(recent) < 3:
+        start = bisect_left(self._history_ts, now_ts - HEAT_SPIKE_WINDOW_SECONDS)
+        recent_temp = list(islice(self._history_temp, start, None))
+        if len(recent_temp) < 3:
             return False
 
-        peak_ts, peak_temp = max(recent, key=lambda item: item[1])
-        if now_ts - peak_ts > HEAT_SPIKE_MAX_AGE_SECONDS:
+        peak_index = max(range(len(recent_temp)), key=recent_temp.__getitem__)
+        peak_temp = recent_temp[peak_index]
+        if now_ts - self._history_ts[start + peak_index] > HEAT_SPIKE_MAX_AGE_SECONDS:
             return False
 
-        min_before = min((temp for ts, temp in recent if ts <= peak_ts), default=None)
-        if min_before is None:
-            return False
+        min_before = min(recent_temp[: peak_index + 1])
 
         rise = peak_temp - min_before
         drop = peak_temp - current_temp
@@ -760,7 +936,7 @@ class AdaptiveThermostat(ClimateEntity):
     ) -> None:
         """Apply bookkeeping when a window disturbance starts or ends."""
         if opened:
-            self._window_candidate = None
+            self._window_candidate.active = False
             self._window_open_since_ts = now_ts
             self._window_recovery_start_ts = None
             self._window_recovery_peak_slope = None
@@ -813,18 +989,30 @@ class AdaptiveThermostat(ClimateEntity):
     def _current_thermal_param_payload(self) -> Dict[str, float]:
         """Return rounded thermal parameter snapshot for diagnostics."""
         params = self._thermal_controller.get_params()
-        return {
-            "tau_r": round(params.tau_r, 2),
-            "tau_th": round(params.tau_th, 2),
-            "K": round(params.K, 3),
-            "p": round(params.p, 3),
-        }
+        # The controller replaces its Params object on every update, so identity
+        # is enough to tell whether the cached payload is still current
+        if params is not self._thermal_params_source:
+            self._thermal_params_source = params
+            self._thermal_params_payload = {
+                "tau_r": round(params.tau_r, 2),
+                "tau_th": round(params.tau_th, 2),
+                "K": round(params.K, 3),
+                "p": round(params.p, 3),
+            }
+        return self._thermal_params_payload
 
     def _iso_or_none(self, ts: Optional[float]) -> Optional[str]:
         """Return ISO timestamp or None."""
         if ts is None:
             return None
-        return dt_util.utc_from_timestamp(ts).isoformat()
+        cached = self._iso_cache.get(ts)
+        if cached is not None:
+            return cached
+        iso = dt_util.utc_from_timestamp(ts).isoformat()
+        if len(self._iso_cache) >= ISO_CACHE_MAX_ENTRIES:
+            self._iso_cache.clear()
+        self._iso_cache[ts] = iso
+        return iso
 
     async def _async_handle_planned_turn_off(self, _now: datetime) -> None:
         """Handle scheduled heater turn-off initiated by the model."""
@@ -841,89 +1029,84 @@ class AdaptiveThermostat(ClimateEntity):
                 self._open_window_detected = False
                 self._window_alert = None
                 self._last_window_event_ts = now_ts
-            if self._window_candidate:
-                self._window_candidate = None
+            if self._window_candidate.active:
+                self._window_candidate.active = False
                 self._attr_extra_state_attributes["window_candidate_active"] = False
             self._window_recovery_start_ts = None
             self._window_recovery_peak_slope = None
             return
 
-        current_temp = (
-            self._filtered_temperature
-            if self._filtered_temperature is not None
-            else self._current_temperature
-        )
+        current_temp = self._current_temperature
         current_measurement_ts = self._last_measurement_ts
 
         if door_window_open:
             if not self._open_window_detected:
                 self._open_window_detected = True
-                self._open_window_baseline_temp = float(current_temp) if current_temp is not None else None
+                self._open_window_baseline_temp = current_temp
                 self._window_alert = "Door/window sensor reported open"
                 self._last_window_event_ts = now_ts
                 self._handle_window_state_transition(now_ts, True)
                 _LOGGER.warning("[%s] Window sensor open - disabling heating", self._entry_id)
                 if self._zone_heater_on:
                     await self._async_turn_heater_off()
-            self._window_candidate = None
+            self._window_candidate.active = False
             self._attr_extra_state_attributes["window_candidate_active"] = False
             return
 
+        candidate = self._window_candidate
+        if (
+            current_measurement_ts is not None
+            and current_measurement_ts == self._last_window_eval_ts
+            and not self._open_window_detected
+            and not candidate.active
+        ):
+            # Same sample as the last idle evaluation; nothing can have changed
+            return
+
         slope_base = self._display_temperature_slope
         if slope_base is None:
             slope_base = self._raw_temperature_slope
         slope_per_hour = (slope_base or 0.0) * 3600.0
-        threshold = self._window_slope_threshold
+        neg_threshold = -self._window_slope_threshold
 
-        candidate = self._window_candidate
-        if candidate and current_measurement_ts is not None:
-            last_measurement = candidate.get("last_measurement_ts")
-            if last_measurement != current_measurement_ts:
-                candidate["last_measurement_ts"] = current_measurement_ts
-                candidate["sample_count"] = candidate.get("sample_count", 1) + 1
+        if candidate.active and current_measurement_ts is not None:
+            if candidate.last_measurement_ts != current_measurement_ts:
+                candidate.last_measurement_ts = current_measurement_ts
+                candidate.sample_count += 1
                 if current_temp is not None:
-                    candidate["last_temp"] = float(current_temp)
+                    candidate.last_temp = current_temp
 
-        if not self._open_window_detected and slope_per_hour <= -threshold:
+        if not self._open_window_detected and slope_per_hour <= neg_threshold:
             if self._recent_heat_spike_detected(now_ts, current_temp):
-                if candidate:
-                    self._window_candidate = None
+                if candidate.active:
+                    candidate.active = False
                     self._attr_extra_state_attributes["window_candidate_active"] = False
                 _LOGGER.debug("[%s] Window detection suppressed (recent heat spike)", self._entry_id)
                 return
-            if candidate is None:
-                start_temp = None
-                if self._prev_measurement_temp is not None:
-                    start_temp = float(self._prev_measurement_temp)
-                elif current_temp is not None:
-                    start_temp = float(current_temp)
-                self._window_candidate = {
-                    "start_ts": now_ts,
-                    "start_temp": start_temp,
-                    "last_temp": float(current_temp) if current_temp is not None else None,
-                    "start_measurement_ts": current_measurement_ts,
-                    "last_measurement_ts": current_measurement_ts,
-                    "sample_count": 1,
-                }
-                candidate = self._window_candidate
+            if not candidate.active:
+                start_temp = self._prev_measurement_temp
+                if start_temp is None:
+                    start_temp = current_temp
+                candidate.start(now_ts, start_temp, current_temp, current_measurement_ts)
                 self._attr_extra_state_attributes["window_candidate_active"] = True
                 _LOGGER.debug("[%s] Window candidate started (slope=%.2f°C/h)", self._entry_id, slope_per_hour)
             else:
                 if current_temp is not None:
-                    candidate["last_temp"] = float(current_temp)
+                    candidate.last_temp = current_temp
 
-            start_temp = candidate.get("start_temp")
-            last_temp = candidate.get("last_temp")
+            start_temp = candidate.start_temp
+            last_temp = candidate.last_temp
             drop = None
             if start_temp is not None and last_temp is not None:
                 drop = start_temp - last_temp
 
             confirm_drop = drop is not None and drop >= WINDOW_CONFIRMATION_DROP
-            sample_count = candidate.get("sample_count", 1)
+            sample_count = candidate.sample_count
+            candidate_age = now_ts - candidate.start_ts
             confirm_duration = (
                 sample_count >= 2
-                and now_ts - candidate["start_ts"] >= WINDOW_CONFIRMATION_SECONDS
-                and slope_per_hour <= -threshold * 0.5
+                and candidate_age >= WINDOW_CONFIRMATION_SECONDS
+                and slope_per_hour <= neg_threshold * WINDOW_CONFIRM_SLOPE_FACTOR
             )
 
             if confirm_drop or confirm_duration:
@@ -932,7 +1115,7 @@ class AdaptiveThermostat(ClimateEntity):
                 self._open_window_baseline_temp = baseline
                 self._window_alert = f"Open window detected (drop {abs(slope_per_hour):.2f}°C/h)"
                 self._last_window_event_ts = now_ts
-                self._window_candidate = None
+                candidate.active = False
                 self._attr_extra_state_attributes["window_candidate_active"] = False
                 self._handle_window_state_transition(now_ts, True)
                 _LOGGER.warning(
@@ -943,26 +1126,28 @@ class AdaptiveThermostat(ClimateEntity):
                 if self._zone_heater_on:
                     await self._async_turn_heater_off()
                 return
-            if sample_count < 2 and now_ts - candidate["start_ts"] >= WINDOW_CANDIDATE_RESET_SECONDS:
+            if sample_count < 2 and candidate_age >= WINDOW_CANDIDATE_RESET_SECONDS:
                 _LOGGER.debug(
                     "[%s] Window candidate expired without confirmation (elapsed=%.0fs)",
                     self._entry_id,
-                    now_ts - candidate["start_ts"],
+                    candidate_age,
                 )
-                self._window_candidate = None
+                candidate.active = False
                 self._attr_extra_state_attributes["window_candidate_active"] = False
         else:
-            if candidate:
-                elapsed = now_ts - candidate.get("start_ts", now_ts)
-                if slope_per_hour > -threshold * 0.2 or elapsed >= WINDOW_CANDIDATE_RESET_SECONDS:
+            if candidate.active:
+                elapsed = now_ts - candidate.start_ts
+                if slope_per_hour > neg_threshold * WINDOW_CLEAR_SLOPE_FACTOR or elapsed >= WINDOW_CANDIDATE_RESET_SECONDS:
                     _LOGGER.debug(
                         "[%s] Window candidate cleared (slope=%.2f°C/h elapsed=%.0fs)",
                         self._entry_id,
                         slope_per_hour,
                         elapsed,
                     )
-                    self._window_candidate = None
+                    candidate.active = False
                     self._attr_extra_state_attributes["window_candidate_active"] = False
+            if not candidate.active and not self._open_window_detected:
+                self._last_window_eval_ts = current_measurement_ts
 
         if self._open_window_detected:
             baseline = self._open_window_baseline_temp
@@ -985,10 +1170,10 @@ class AdaptiveThermostat(ClimateEntity):
             max_drop = None
             baseline = self._open_window_baseline_temp
             if baseline is not None and current_temp is not None:
-                drop = float(baseline) - float(current_temp)
+                drop = baseline - current_temp
                 max_drop = WINDOW_RECOVERY_SMALL_DROP_ABS
-                if isinstance(self._current_outdoor_temp, (int, float)):
-                    delta_outdoor = max(0.0, float(baseline) - float(self._current_outdoor_temp))
+                if self._current_outdoor_temp is not None:
+                    delta_outdoor = max(0.0, baseline - self._current_outdoor_temp)
                     max_drop = max(max_drop, delta_outdoor * WINDOW_RECOVERY_SMALL_DROP_FRACTION)
 
             flat_elapsed = None
@@ -1021,7 +1206,7 @@ class AdaptiveThermostat(ClimateEntity):
                     slope_per_hour,
                     "n/a"
                     if self._current_outdoor_temp is None
-                    else f"{float(self._current_outdoor_temp):.1f}",
+                    else f"{self._current_outdoor_temp:.1f}",
                 )
                 return
 
@@ -1068,7 +1253,6 @@ class AdaptiveThermostat(ClimateEntity):
         now: datetime,
         motion_active: Optional[bool],
         door_window_open: Optional[bool],
-        heater_states: List[Dict[str, Any]],
         central_state: Optional[Dict[str, Any]],
     ) -> None:
         """Update extra state attributes for diagnostics and the card."""
@@ -1078,84 +1262,53 @@ class AdaptiveThermostat(ClimateEntity):
             else None
         )
 
-        instant_slope_per_hour = self._display_temperature_slope * 3600.0
-        hourly_slope_per_hour = self._hourly_temperature_slope
-        raw_slope_per_hour = self._raw_temperature_slope * 3600.0
-
-        effective_temp = self._filtered_temperature or self._current_temperature
-        heat_on_threshold = (
-            self._target_temperature - self._thermal_controller.deadband
-            if self._target_temperature is not None
-            else None
-        )
-        heat_off_threshold = (
-            self._target_temperature + self._thermal_controller.deadband
-            if self._target_temperature is not None
+        tc = self._thermal_controller
+        deadband = tc.deadband
+        target = self._target_temperature
+        current_temp = self._current_temperature
+        recovery_peak_slope = self._window_recovery_peak_slope
+        # Assign in place: the key set is fixed, so no temporary dict is needed
+        attrs = self._attr_extra_state_attributes
+        attrs["current_temperature"] = current_temp
+        attrs["filtered_temperature"] = current_temp
+        attrs["current_humidity"] = self._current_humidity
+        attrs["current_outdoor_temp"] = self._current_outdoor_temp
+        attrs["central_heater_state"] = central_state
+        attrs["zone_heater_on"] = self._zone_heater_on
+        attrs["temperature_slope_instant_per_hour"] = round(self._display_temperature_slope * 3600.0, 3)
+        attrs["temperature_slope_per_hour"] = round(self._hourly_temperature_slope, 3)
+        attrs["raw_temperature_slope_per_hour"] = round(self._raw_temperature_slope * 3600.0, 3)
+        attrs["window_open_detected"] = self._open_window_detected
+        attrs["window_alert"] = self._window_alert
+        attrs["last_window_event"] = last_window_event
+        attrs["window_candidate_active"] = self._window_candidate.active
+        attrs["door_window_open"] = door_window_open
+        attrs["motion_active"] = motion_active
+        attrs["manual_override"] = self._manual_override
+        attrs["heat_on_threshold"] = target - deadband if target is not None else None
+        attrs["heat_off_threshold"] = target + deadband if target is not None else None
+        attrs["heat_on_delta"] = deadband
+        attrs["heat_off_delta"] = deadband
+        attrs["effective_control_temperature"] = current_temp
+        attrs["last_updated"] = now.isoformat()
+        attrs["window_recovery_until"] = self._iso_or_none(self._window_heat_reenable_at)
+        attrs["window_data_block_until"] = self._iso_or_none(self._window_data_reenable_at)
+        attrs["window_recovery_started_at"] = self._iso_or_none(self._window_recovery_start_ts)
+        attrs["window_recovery_peak_slope_per_hour"] = (
+            round(recovery_peak_slope, 3)
+            if isinstance(recovery_peak_slope, (int, float))
             else None
         )
-        window_recovery_iso = self._iso_or_none(self._window_heat_reenable_at)
-        data_block_iso = self._iso_or_none(self._window_data_reenable_at)
-        planned_off_iso = self._iso_or_none(self._planned_heater_off_ts)
-        thermal_params = self._current_thermal_param_payload()
-        window_recovery_started_iso = self._iso_or_none(self._window_recovery_start_ts)
-        window_recovery_peak = (
-            round(self._window_recovery_peak_slope, 3)
-            if isinstance(self._window_recovery_peak_slope, (int, float))
-            else None
-        )
-        cycle_diag = {}
-        if self._last_cycle_diagnostics:
-            cycle_diag = {
-                "last_cycle_ratio": round(self._last_cycle_diagnostics["ratio_actual_to_pred"], 3),
-                "last_cycle_peak_predicted": round(self._last_cycle_diagnostics["predicted_peak"], 3),
-                "last_cycle_peak_actual": round(self._last_cycle_diagnostics["actual_peak"], 3),
-                "last_cycle_tau_on": round(self._last_cycle_diagnostics["tau_on"], 1),
-                "last_cycle_overshoot": round(self._last_cycle_diagnostics["overshoot"], 3),
-                "last_cycle_undershoot": round(self._last_cycle_diagnostics["undershoot"], 3),
-            }
-
-        self._attr_extra_state_attributes.update(
-            {
-                "current_temperature": self._current_temperature,
-                "filtered_temperature": self._filtered_temperature,
-                "current_humidity": self._current_humidity,
-                "current_outdoor_temp": self._current_outdoor_temp,
-                "heater_states": heater_states,
-                "central_heater_state": central_state,
-                "zone_heater_on": self._zone_heater_on,
-                "temperature_slope_instant_per_hour": round(instant_slope_per_hour, 3),
-                "temperature_slope_per_hour": round(hourly_slope_per_hour, 3),
-                "raw_temperature_slope_per_hour": round(raw_slope_per_hour, 3),
-                "window_open_detected": self._open_window_detected,
-                "window_alert": self._window_alert,
-                "last_window_event": last_window_event,
-                "window_candidate_active": bool(self._window_candidate),
-                "door_window_open": door_window_open,
-                "motion_active": motion_active,
-                "manual_override": self._manual_override,
-                "heat_on_threshold": heat_on_threshold,
-                "heat_off_threshold": heat_off_threshold,
-                "heat_on_delta": self._thermal_controller.deadband,
-                "heat_off_delta": self._thermal_controller.deadband,
-                "effective_control_temperature": effective_temp,
-                "last_updated": now.isoformat(),
-                "window_recovery_until": window_recovery_iso,
-                "window_data_block_until": data_block_iso,
-                "window_recovery_started_at": window_recovery_started_iso,
-                "window_recovery_peak_slope_per_hour": window_recovery_peak,
-                "planned_zone_off_time": planned_off_iso,
-                "planned_zone_on_duration": self._planned_on_duration,
-                "thermal_params": thermal_params,
-                "post_window_dampen_cycles": self._post_window_dampen_cycles,
-                "valve_error": self._valve_error,
-                "valve_error_at": self._iso_or_none(self._valve_error_at),
-                "min_on_s": self._thermal_controller.min_on_s,
-                "min_off_s": self._thermal_controller.min_off_s,
-                "min_on_override_s": self._thermal_controller.get_min_on_override(),
-            }
-        )
-        if cycle_diag:
-            self._attr_extra_state_attributes.update(cycle_diag)
+        attrs["planned_zone_off_time"] = self._iso_or_none(self._planned_heater_off_ts)
+        attrs["planned_zone_on_duration"] = self._planned_on_duration
+        attrs["thermal_params"] = self._current_thermal_param_payload()
+        attrs["post_window_dampen_cycles"] = self._post_window_dampen_cycles
+        attrs["valve_error"] = self._valve_error
+        attrs["valve_error_at"] = self._iso_or_none(self._valve_error_at)
+        attrs["min_on_s"] = tc.min_on_s
+        attrs["min_off_s"] = tc.min_off_s
+        attrs["min_on_override_s"] = tc.get_min_on_override()
+        # last_cycle_* diagnostics are written once per cycle in _finalize_cycle_evaluation
 
     def _update_cycle_tracking(self, now_ts: float, effective_temp: float) -> None:
         """Update heating cycle diagnostics and trigger post-cycle learning."""
@@ -1164,8 +1317,8 @@ class AdaptiveThermostat(ClimateEntity):
             cycle["last_temp"] = effective_temp
             prev_peak = cycle.get("peak_temp", effective_temp)
             if prev_peak is None or effective_temp >= prev_peak:
-                cycle["peak_temp"] = float(effective_temp)
-                cycle["peak_ts"] = float(now_ts)
+                cycle["peak_temp"] = effective_temp
+                cycle["peak_ts"] = now_ts
 
         if not self._pending_cycle_eval:
             return
@@ -1174,8 +1327,8 @@ class AdaptiveThermostat(ClimateEntity):
         cycle["last_temp"] = effective_temp
         prev_peak = cycle.get("peak_temp", effective_temp)
         if prev_peak is None or effective_temp >= prev_peak:
-            cycle["peak_temp"] = float(effective_temp)
-            cycle["peak_ts"] = float(now_ts)
+            cycle["peak_temp"] = effective_temp
+            cycle["peak_ts"] = now_ts
 
         off_ts = float(cycle.get("off_ts", now_ts))
         time_since_off = now_ts - off_ts
@@ -1184,10 +1337,10 @@ class AdaptiveThermostat(ClimateEntity):
         slope_cooling = self._raw_temperature_slope <= CYCLE_RESIDUAL_SLOPE_THRESHOLD
 
         follow_until = cycle.get("follow_until_ts")
-        if not isinstance(follow_until, (int, float)):
+        if follow_until is None:
             predicted_tail = cycle.get("predicted_tail")
             follow_window = CYCLE_PEAK_FOLLOWUP_SECONDS
-            if isinstance(predicted_tail, (int, float)):
+            if predicted_tail is not None:
                 follow_window = max(follow_window, float(predicted_tail) + 300.0)
             follow_until = off_ts + follow_window
             cycle["follow_until_ts"] = follow_until
@@ -1196,7 +1349,7 @@ class AdaptiveThermostat(ClimateEntity):
         should_finalize = False
         if self._zone_heater_on:
             should_finalize = True
-        elif isinstance(follow_until, (int, float)) and now_ts >= follow_until:
+        elif follow_until is not None and now_ts >= follow_until:
             should_finalize = True
         elif below_target and slope_cooling and time_since_off >= CYCLE_PEAK_FOLLOWUP_SECONDS:
             should_finalize = True
@@ -1213,17 +1366,18 @@ class AdaptiveThermostat(ClimateEntity):
         start_ts = cycle.get("start_ts")
         start_temp = cycle.get("start_temp")
         planned_duration = cycle.get("planned_duration")
-        if not isinstance(start_ts, (int, float)):
+        if start_ts is None:
             return
-        if not isinstance(start_temp, (int, float)) or not isinstance(planned_duration, (int, float)):
+        if start_temp is None or planned_duration is None:
             return
 
+        tc = self._thermal_controller
         elapsed = max(0.0, now_ts - float(start_ts))
-        min_sample = max(30.0, float(self._thermal_controller.min_on_s) * 0.5)
+        min_sample = max(30.0, float(tc.min_on_s) * 0.5)
         if elapsed < min_sample:
             return
 
-        predicted_delta = self._thermal_controller.predict_on_delta(elapsed)
+        predicted_delta = tc.predict_on_delta(elapsed)
         actual_delta = effective_temp - float(start_temp)
         if predicted_delta <= 0.0 or actual_delta <= 0.0:
             return
@@ -1233,14 +1387,14 @@ class AdaptiveThermostat(ClimateEntity):
             return
 
         new_duration = float(planned_duration) / ratio
-        new_duration = max(float(self._thermal_controller.min_on_s), new_duration)
+        new_duration = max(float(tc.min_on_s), new_duration)
         if new_duration >= float(planned_duration) - 10.0:
             return
 
         new_off_ts = float(start_ts) + new_duration
         if new_off_ts < now_ts:
             new_off_ts = now_ts
-            new_duration = max(float(self._thermal_controller.min_on_s), now_ts - float(start_ts))
+            new_duration = max(float(tc.min_on_s), now_ts - float(start_ts))
 
         if self._planned_off_unsub:
             self._planned_off_unsub()
@@ -1269,10 +1423,10 @@ class AdaptiveThermostat(ClimateEntity):
         cycle = self._pending_cycle_eval
         peak_temp = cycle.get("peak_temp")
         if force_peak is not None:
-            peak_temp = max(force_peak, peak_temp) if isinstance(peak_temp, (int, float)) else force_peak
+            peak_temp = max(force_peak, peak_temp) if peak_temp is not None else force_peak
         if peak_temp is None:
             fallback = cycle.get("off_temp") or cycle.get("last_temp") or cycle.get("start_temp")
-            peak_temp = float(fallback) if isinstance(fallback, (int, float)) else None
+            peak_temp = float(fallback) if fallback is not None else None
 
         start_temp = cycle.get("start_temp")
         tau_on = cycle.get("actual_on_duration") or cycle.get("planned_duration")
@@ -1281,7 +1435,7 @@ class AdaptiveThermostat(ClimateEntity):
         peak_ts = cycle.get("peak_ts")
         off_ts = cycle.get("off_ts")
         tail_delay = None
-        if isinstance(peak_ts, (int, float)) and isinstance(off_ts, (int, float)):
+        if peak_ts is not None and off_ts is not None:
             tail_delay = max(0.0, float(peak_ts) - float(off_ts))
 
         self._pending_cycle_eval = None
@@ -1290,45 +1444,47 @@ class AdaptiveThermostat(ClimateEntity):
         self._attr_extra_state_attributes["cycle_time_to_target_s"] = None
         self._attr_extra_state_attributes["pending_tail_follow_until"] = None
         if start_temp is None or tau_on is None or peak_temp is None:
-            self.async_write_ha_state()
+            self._async_write_ha_state_if_changed()
             return
 
-        diagnostics = self._thermal_controller.register_cycle_result(
+        tc = self._thermal_controller
+        diagnostics = tc.register_cycle_result(
             float(start_temp),
             float(peak_temp),
             float(tau_on),
             temp_target=float(target),
-            temp_cut=float(temp_cut) if isinstance(temp_cut, (int, float)) else None,
+            temp_cut=float(temp_cut) if temp_cut is not None else None,
             tail_peak_delay_s=tail_delay,
         )
         self._attr_extra_state_attributes["thermal_params"] = self._current_thermal_param_payload()
         self._attr_extra_state_attributes["last_cycle_tail_delay_s"] = tail_delay
         if diagnostics:
             self._last_cycle_diagnostics = diagnostics
-            self._attr_extra_state_attributes["last_cycle_observed_at"] = self._iso_or_none(now_ts)
+            attrs = self._attr_extra_state_attributes
+            attrs["last_cycle_ratio"] = round(diagnostics["ratio_actual_to_pred"], 3)
+            attrs["last_cycle_peak_predicted"] = round(diagnostics["predicted_peak"], 3)
+            attrs["last_cycle_peak_actual"] = round(diagnostics["actual_peak"], 3)
+            attrs["last_cycle_tau_on"] = round(diagnostics["tau_on"], 1)
+            attrs["last_cycle_overshoot"] = round(diagnostics["overshoot"], 3)
+            attrs["last_cycle_undershoot"] = round(diagnostics["undershoot"], 3)
+            attrs["last_cycle_observed_at"] = self._iso_or_none(now_ts)
             if cycle.get("min_on_clamped"):
                 overshoot = diagnostics.get("overshoot")
-                if isinstance(overshoot, (int, float)) and overshoot > 0.2:
-                    current_override = self._thermal_controller.get_min_on_override()
-                    proposed_override = max(30.0, float(self._thermal_controller.min_on_s) * 0.8)
+                if overshoot is not None and overshoot > 0.2:
+                    current_override = tc.get_min_on_override()
+                    proposed_override = max(30.0, float(tc.min_on_s) * 0.8)
                     if current_override is None or proposed_override < float(current_override) - 1.0:
-                        self._thermal_controller.set_min_on_override(proposed_override)
-                        self._attr_extra_state_attributes["min_on_override_s"] = (
-                            self._thermal_controller.get_min_on_override()
-                        )
+                        tc.set_min_on_override(proposed_override)
+                        self._attr_extra_state_attributes["min_on_override_s"] = tc.get_min_on_override()
             self._mark_state_dirty()
-        self.async_write_ha_state()
+        self._async_write_ha_state_if_changed()
 
     async def _async_control_heating(self, now_ts: float) -> None:
         """Apply model-based control with window-aware gating."""
         if self._target_temperature is None:
             return
 
-        effective_temp = (
-            self._filtered_temperature
-            if self._filtered_temperature is not None
-            else self._current_temperature
-        )
+        effective_temp = self._current_temperature
         if effective_temp is None:
             return
 
@@ -1339,18 +1495,20 @@ class AdaptiveThermostat(ClimateEntity):
                 await self._async_turn_heater_off()
             return
 
+        # min_on_s/min_off_s may change when a cycle is finalized; alias the controller only
+        tc = self._thermal_controller
         min_on_active = (
             self._zone_heater_on
             and self._last_command_timestamp is not None
-            and now_ts - self._last_command_timestamp < self._thermal_controller.min_on_s
+            and now_ts - self._last_command_timestamp < tc.min_on_s
         )
         min_off_active = (
             not self._zone_heater_on
             and self._last_command_timestamp is not None
-            and now_ts - self._last_command_timestamp < self._thermal_controller.min_off_s
+            and now_ts - self._last_command_timestamp < tc.min_off_s
         )
 
-        deadband = self._thermal_controller.deadband
+        deadband = tc.deadband
         upper_band = self._target_temperature + deadband
         lower_band = self._target_temperature - deadband
 
@@ -1379,7 +1537,8 @@ class AdaptiveThermostat(ClimateEntity):
             return
 
         if self._window_heat_reenable_at is not None and now_ts < self._window_heat_reenable_at:
-            if effective_temp <= lower_band:
+            # Logged on every tick of the recovery window; skip the arithmetic unless debugging
+            if effective_temp <= lower_band and _LOGGER.isEnabledFor(logging.DEBUG):
                 _LOGGER.debug(
                     "[%s] Heating suppressed for %ss post-window recovery",
                     self._entry_id,
@@ -1397,39 +1556,40 @@ class AdaptiveThermostat(ClimateEntity):
             cycle = self._pending_cycle_eval
             follow_until = cycle.get("follow_until_ts")
             wait_for_tail = False
-            if isinstance(follow_until, (int, float)) and now_ts < float(follow_until):
+            if follow_until is not None and now_ts < float(follow_until):
                 predicted_peak_temp = cycle.get("predicted_peak_temp")
                 expected_target_ts = cycle.get("expected_target_ts")
                 slope = self._raw_temperature_slope
                 remaining_gain = None
-                if isinstance(predicted_peak_temp, (int, float)):
+                if predicted_peak_temp is not None:
                     remaining_gain = float(predicted_peak_temp) - effective_temp
                 if remaining_gain is not None and remaining_gain > 0.05:
                     if slope >= CYCLE_RESIDUAL_SLOPE_THRESHOLD:
                         wait_for_tail = True
-                elif isinstance(expected_target_ts, (int, float)) and now_ts < float(expected_target_ts) + CYCLE_TARGET_TIME_GRACE:
+                elif expected_target_ts is not None and now_ts < float(expected_target_ts) + CYCLE_TARGET_TIME_GRACE:
                     if slope >= CYCLE_RESIDUAL_SLOPE_THRESHOLD:
                         wait_for_tail = True
             if wait_for_tail and (self._target_temperature - effective_temp) <= CYCLE_RESIDUAL_HOLD_DELTA_MAX:
-                _LOGGER.debug(
-                    "[%s] Deferring new heating cycle to observe residual tail (delta=%.3f°C, slope=%.4f°C/s)",
-                    self._entry_id,
-                    self._target_temperature - effective_temp,
-                    self._raw_temperature_slope,
-                )
+                if _LOGGER.isEnabledFor(logging.DEBUG):
+                    _LOGGER.debug(
+                        "[%s] Deferring new heating cycle to observe residual tail (delta=%.3f°C, slope=%.4f°C/s)",
+                        self._entry_id,
+                        self._target_temperature - effective_temp,
+                        self._raw_temperature_slope,
+                    )
                 return
 
-        raw_tau_on = self._thermal_controller.propose_on_time(effective_temp, self._target_temperature)
-        min_on_s = float(self._thermal_controller.min_on_s)
+        raw_tau_on = tc.propose_on_time(effective_temp, self._target_temperature)
+        min_on_s = float(tc.min_on_s)
         tau_on = max(raw_tau_on, min_on_s)
-        tail_delay = self._thermal_controller.residual_peak_delay()
+        tail_delay = tc.residual_peak_delay()
         if self._post_window_dampen_cycles > 0:
-            tau_on = max(float(self._thermal_controller.min_on_s), tau_on * WINDOW_POST_RECOVERY_DAMPEN_SCALE)
+            tau_on = max(min_on_s, tau_on * WINDOW_POST_RECOVERY_DAMPEN_SCALE)
         time_to_target = tau_on + tail_delay
         if tau_on <= 0:
             return
 
-        predicted_peak_temp = self._thermal_controller.predict_peak(float(effective_temp), float(tau_on))
+        predicted_peak_temp = tc.predict_peak(effective_temp, float(tau_on))
 
         if self._planned_off_unsub:
             self._planned_off_unsub()
@@ -1450,17 +1610,17 @@ class AdaptiveThermostat(ClimateEntity):
             return
         self._active_cycle = {
             "start_ts": now_ts,
-            "start_temp": float(effective_temp),
+            "start_temp": effective_temp,
             "target": float(self._target_temperature),
             "planned_duration": float(tau_on),
             "raw_duration": float(raw_tau_on),
             "min_on_clamped": raw_tau_on < min_on_s - 1e-3,
-            "peak_temp": float(effective_temp),
-            "peak_ts": float(now_ts),
+            "peak_temp": effective_temp,
+            "peak_ts": now_ts,
             "predicted_tail": float(tail_delay),
             "predicted_time_to_target": float(time_to_target),
-            "predicted_peak_temp": float(predicted_peak_temp),
-            "expected_target_ts": float(now_ts + time_to_target),
+            "predicted_peak_temp": predicted_peak_temp,
+            "expected_target_ts": now_ts + time_to_target,
         }
         if self._post_window_dampen_cycles > 0:
             self._post_window_dampen_cycles = max(0, self._post_window_dampen_cycles - 1)
@@ -1470,12 +1630,13 @@ class AdaptiveThermostat(ClimateEntity):
         self._attr_extra_state_attributes["planned_zone_on_duration"] = tau_on
         self._attr_extra_state_attributes["planned_zone_off_time"] = self._iso_or_none(self._planned_heater_off_ts)
         self._planned_off_unsub = async_call_later(self.hass, tau_on, self._async_handle_planned_turn_off)
-        self.async_write_ha_state()
+        self._async_write_ha_state_if_changed()
 
     async def _async_handle_auto_onoff(
         self,
         outdoor_temp: Optional[float],
         backup_outdoor_temp: Optional[float],
+        now_ts: float,
     ) -> None:
         """Automatically toggle HVAC mode based on outdoor temperature."""
         temp = outdoor_temp if outdoor_temp is not None else backup_outdoor_temp
@@ -1496,7 +1657,7 @@ class AdaptiveThermostat(ClimateEntity):
                 self._auto_on_temp,
             )
             self._hvac_mode = HVACMode.HEAT
-            await self._async_control_heating(dt_util.utcnow().timestamp())
+            await self._async_control_heating(now_ts)
             self._mark_state_dirty()
         elif temp > self._auto_off_temp and self._hvac_mode == HVACMode.HEAT:
             _LOGGER.info(
@@ -1517,12 +1678,11 @@ class AdaptiveThermostat(ClimateEntity):
 
         if not self._heater_entity_ids:
             self._set_valve_error("No heater entities configured")
-            self.async_write_ha_state()
+            self._async_write_ha_state_if_changed()
             return False
 
         self._clear_valve_error()
-        for heater_id in self._heater_entity_ids:
-            await self._async_turn_on_entity(heater_id, "zone heater/valve")
+        await self._async_switch_heater_groups(self._heater_on_groups, True)
 
         results = await asyncio.gather(
             *[self._async_wait_for_heater_open(heater_id) for heater_id in self._heater_entity_ids]
@@ -1542,13 +1702,13 @@ class AdaptiveThermostat(ClimateEntity):
             self._zone_heater_on = False
             self._attr_extra_state_attributes["zone_heater_on"] = False
             self._mark_state_dirty()
-            self.async_write_ha_state()
+            self._async_write_ha_state_if_changed()
             return False
 
         if self._central_heater_entity_id:
             await self._async_coordinate_central_heater_on()
 
-        now_ts = dt_util.utcnow().timestamp()
+        now_ts = time.time()
         self._zone_heater_on = True
         self._last_command_timestamp = now_ts
         self._attr_extra_state_attributes["zone_heater_on"] = True
@@ -1585,35 +1745,29 @@ class AdaptiveThermostat(ClimateEntity):
         if self._central_heater_entity_id:
             await self._async_coordinate_central_heater_off(other_zones_need_heat)
 
-        now_ts = dt_util.utcnow().timestamp()
-        off_temp = (
-            self._filtered_temperature
-            if self._filtered_temperature is not None
-            else self._current_temperature
-        )
+        now_ts = time.time()
+        off_temp = self._current_temperature
 
         if self._pending_cycle_eval:
-            self._finalize_cycle_evaluation(now_ts, force_peak=off_temp if isinstance(off_temp, (int, float)) else None)
+            self._finalize_cycle_evaluation(now_ts, force_peak=off_temp)
 
         if self._active_cycle:
             cycle = dict(self._active_cycle)
             cycle["off_ts"] = now_ts
             start_ts = cycle.get("start_ts")
-            if isinstance(start_ts, (int, float)):
-                cycle["actual_on_duration"] = max(0.0, now_ts - float(start_ts))
-            if isinstance(off_temp, (int, float)):
-                cycle["last_temp"] = float(off_temp)
+            if start_ts is not None:
+                on_duration = now_ts - start_ts
+                cycle["actual_on_duration"] = on_duration if on_duration > 0.0 else 0.0
+            if off_temp is not None:
+                cycle["last_temp"] = off_temp
                 prev_peak = cycle.get("peak_temp", off_temp)
-                cycle["peak_temp"] = max(float(off_temp), float(prev_peak))
-                cycle["off_temp"] = float(off_temp)
-                if "peak_ts" not in cycle or not isinstance(cycle.get("peak_ts"), (int, float)):
-                    cycle["peak_ts"] = float(now_ts)
-            else:
-                if "peak_ts" not in cycle or not isinstance(cycle.get("peak_ts"), (int, float)):
-                    cycle["peak_ts"] = float(now_ts)
+                cycle["peak_temp"] = off_temp if off_temp > prev_peak else prev_peak
+                cycle["off_temp"] = off_temp
+            if cycle.get("peak_ts") is None:
+                cycle["peak_ts"] = now_ts
             predicted_tail = cycle.get("predicted_tail")
             follow_window = CYCLE_PEAK_FOLLOWUP_SECONDS
-            if isinstance(predicted_tail, (int, float)):
+            if predicted_tail is not None:
                 follow_window = max(follow_window, float(predicted_tail) + 300.0)
             cycle["follow_until_ts"] = now_ts + follow_window
             self._pending_cycle_eval = cycle
@@ -1627,8 +1781,7 @@ class AdaptiveThermostat(ClimateEntity):
 
     async def _async_close_zone_valves(self) -> None:
         """Close all zone valves immediately."""
-        for heater_id in self._heater_entity_ids:
-            await self._async_turn_off_entity(heater_id, "zone heater/valve")
+        await self._async_switch_heater_groups(self._heater_off_groups, False)
 
     async def _async_delayed_close_zone_valves(self, delay: float) -> None:
         """Close zone valves after a delay."""
@@ -1680,21 +1833,21 @@ class AdaptiveThermostat(ClimateEntity):
 
     async def _async_check_other_zones_need_heat(self) -> bool:
         """Check if another thermostat using the same central heater still requests heat."""
-        domain_data = self.hass.data.get(DOMAIN, {})
-        entities = domain_data.get("entities", {})
-        for entity_id, entity in entities.items():
+        siblings = self.hass.data[DOMAIN].get("central_heater_zones", {}).get(
+            self._central_heater_entity_id, ()
+        )
+        for entity in siblings:
             if (
                 entity is not self
-                and getattr(entity, "_central_heater_entity_id", None) == self._central_heater_entity_id
-                and getattr(entity, "_zone_heater_on", False)
-                and getattr(entity, "_hvac_mode", HVACMode.OFF) == HVACMode.HEAT
+                and entity._zone_heater_on
+                and entity._hvac_mode == HVACMode.HEAT
             ):
                 return True
         return False
 
     def _is_heater_open_state(self, entity_id: str, state_value: str) -> bool:
         """Return True if the heater entity reports an open/on state."""
-        domain = entity_id.split(".", 1)[0] if "." in entity_id else ""
+        domain = self._entity_domain(entity_id)
         if domain == "valve":
             return state_value == "open"
         if domain == "climate":
@@ -1705,24 +1858,24 @@ class AdaptiveThermostat(ClimateEntity):
         self, heater_id: str
     ) -> Tuple[str, Optional[str]]:
         """Wait for a heater entity to report open/on or timeout."""
-        start_ts = dt_util.utcnow().timestamp()
+        deadline = time.monotonic() + VALVE_OPEN_TIMEOUT_SECONDS
         last_state: Optional[str] = None
         while True:
-            state = self.hass.states.get(heater_id)
+            state = self._states_get(heater_id)
             if state:
                 last_state = state.state
-                if state.state in ("unknown", "unavailable"):
+                if state.state in _INVALID_STATES:
                     return "unavailable", state.state
                 if self._is_heater_open_state(heater_id, state.state):
                     return "open", state.state
-            if dt_util.utcnow().timestamp() - start_ts >= VALVE_OPEN_TIMEOUT_SECONDS:
+            if time.monotonic() >= deadline:
                 return "timeout", last_state
             await asyncio.sleep(VALVE_OPEN_POLL_SECONDS)
 
     def _set_valve_error(self, message: str) -> None:
         """Store a valve error for UI display."""
         self._valve_error = message
-        self._valve_error_at = dt_util.utcnow().timestamp()
+        self._valve_error_at = time.time()
         self._attr_extra_state_attributes["valve_error"] = message
         self._attr_extra_state_attributes["valve_error_at"] = self._iso_or_none(self._valve_error_at)
 
@@ -1739,63 +1892,106 @@ class AdaptiveThermostat(ClimateEntity):
         """Helper to turn on a Home Assistant entity."""
         if not entity_id:
             return
-        domain, service = self._resolve_domain_and_service(entity_id, True)
-        try:
-            await self.hass.services.async_call(
-                domain,
-                service,
-                {"entity_id": entity_id},
-                blocking=True,
-            )
-        except Exception as err:  # pylint: disable=broad-except
-            _LOGGER.error("[%s] Failed to turn ON %s %s: %s", self._entry_id, label, entity_id, err)
+        domain, service = self._turn_on_services.get(entity_id) or self._resolve_domain_and_service(
+            entity_id, True
+        )
+        await self._async_call_service(domain, service, entity_id, label, True)
 
     async def _async_turn_off_entity(self, entity_id: Optional[str], label: str) -> None:
         """Helper to turn off a Home Assistant entity."""
         if not entity_id:
             return
-        domain, service = self._resolve_domain_and_service(entity_id, False)
+        domain, service = self._turn_off_services.get(entity_id) or self._resolve_domain_and_service(
+            entity_id, False
+        )
+        await self._async_call_service(domain, service, entity_id, label, False)
+
+    async def _async_switch_heater_groups(
+        self, groups: Dict[Tuple[str, str], List[str]], turn_on: bool
+    ) -> None:
+        """Switch zone heaters with one service call per (domain, service) group."""
+        if len(groups) == 1:
+            (domain, service), entity_ids = next(iter(groups.items()))
+            await self._async_call_service(domain, service, entity_ids, "zone heater/valve", turn_on)
+            return
+        await asyncio.gather(
+            *[
+                self._async_call_service(domain, service, entity_ids, "zone heater/valve", turn_on)
+                for (domain, service), entity_ids in groups.items()
+            ]
+        )
+
+    async def _async_call_service(
+        self,
+        domain: str,
+        service: str,
+        entity_id: str | List[str],
+        label: str,
+        turn_on: bool,
+    ) -> None:
+        """Call a switching service, logging instead of raising on failure."""
         try:
-            await self.hass.services.async_call(
+            await self._services_call(
                 domain,
                 service,
                 {"entity_id": entity_id},
                 blocking=True,
             )
         except Exception as err:  # pylint: disable=broad-except
-            _LOGGER.error("[%s] Failed to turn OFF %s %s: %s", self._entry_id, label, entity_id, err)
+            _LOGGER.error(
+                "[%s] Failed to turn %s %s %s: %s",
+                self._entry_id,
+                "ON" if turn_on else "OFF",
+                label,
+                entity_id if isinstance(entity_id, str) else ", ".join(entity_id),
+                err,
+            )
+
+    def _group_by_service(
+        self, entity_ids: List[str], turn_on: bool
+    ) -> Dict[Tuple[str, str], List[str]]:
+        """Group entities by the (domain, service) that switches them."""
+        services = self._turn_on_services if turn_on else self._turn_off_services
+        groups: Dict[Tuple[str, str], List[str]] = {}
+        for entity_id in entity_ids:
+            if entity_id:
+                groups.setdefault(services[entity_id], []).append(entity_id)
+        return groups
 
     def _resolve_domain_and_service(self, entity_id: str, turn_on: bool) -> Tuple[str, str]:
         """Resolve appropriate service for an entity."""
-        if "." not in entity_id:
+        domain = self._entity_domain(entity_id)
+        if not domain:
             return "switch", "turn_on" if turn_on else "turn_off"
-        domain = entity_id.split(".", 1)[0]
         if domain == "valve":
             return "valve", "open_valve" if turn_on else "close_valve"
-        if domain in {"switch", "input_boolean", "climate"}:
-            return domain, "turn_on" if turn_on else "turn_off"
         return domain, "turn_on" if turn_on else "turn_off"
 
+    def _entity_domain(self, entity_id: str) -> str:
+        """Return the domain of an entity, cached for configured entities."""
+        domain = self._entity_domains.get(entity_id)
+        if domain is None:
+            domain = entity_id.split(".", 1)[0] if "." in entity_id else ""
+        return domain
+
     def _gather_heater_states(self) -> List[Dict[str, Any]]:
         """Return current state of each heater entity."""
-        states: List[Dict[str, Any]] = []
-        for heater_id in self._heater_entity_ids:
-            state = self.hass.states.get(heater_id)
-            if state:
-                states.append(
-                    {
-                        "entity_id": heater_id,
-                        "state": state.state,
-                        "friendly_name": state.attributes.get("friendly_name", heater_id),
-                    }
-                )
-        return states
+        states_get = self._states_get
+        return [
+            {
+                "entity_id": heater_id,
+                "state": state.state,
+                "friendly_name": state.attributes.get("friendly_name", heater_id),
+            }
+            for heater_id in self._heater_entity_ids
+            if (state := states_get(heater_id))
+        ]
 
     def _gather_central_state(self) -> Optional[Dict[str, Any]]:
         """Return central heater state."""
         if not self._central_heater_entity_id:
             return None
-        state = self.hass.states.get(self._central_heater_entity_id)
+        state = self._states_get(self._central_heater_entity_id)
         if not state:
             return None
         return {
@@ -1806,41 +2002,48 @@ class AdaptiveThermostat(ClimateEntity):
 
     def _serialize_runtime_state(self) -> Dict[str, Any]:
         """Serialize runtime state for persistence."""
-        hvac_mode_value = self._hvac_mode.value if isinstance(self._hvac_mode, HVACMode) else HVACMode.OFF.value
         return {
-            "hvac_mode": hvac_mode_value,
+            "hvac_mode": self._hvac_mode.value,
             "target_temperature": self._target_temperature,
             "current_preset": self._current_preset,
             "manual_override": self._manual_override,
             "zone_heater_on": self._zone_heater_on,
             "thermal_state": self._thermal_controller.get_runtime_state(),
-            "preset_targets": self._presets,
+            # Copied so the cached payload can be compared against later snapshots
+            "preset_targets": dict(self._presets),
         }
 
     def _mark_state_dirty(self) -> None:
-        """Schedule persistence of runtime state."""
-        if not self._state_store:
+        """Schedule persistence of runtime state.
+
+        The store is shared by all thermostats; its delayed save is re-armed
+        whenever a zone becomes dirty, so changes across zones within the delay
+        share one write.
+        """
+        if not self._state_store or self._state_dirty:
+            return
+        if self._serialize_runtime_state() == self._state_cache_ref.get(self._entry_id):
+            # Same content as the last persisted payload; skip the write
             return
         self._state_dirty = True
-        if self._state_save_unsub is None:
-            self._state_save_unsub = async_call_later(
-                self.hass, STATE_SAVE_DELAY_SECONDS, self._async_persist_runtime_state
-            )
+        self._state_store.async_delay_save(self._collect_runtime_state, STATE_SAVE_DELAY_SECONDS)
 
-    async def _async_persist_runtime_state(self, _now: Optional[datetime] = None) -> None:
-        """Persist runtime state."""
-        self._state_save_unsub = None
+    @callback
+    def _collect_runtime_state(self) -> Dict[str, Any]:
+        """Serialize every dirty thermostat into the shared cache and return it."""
+        domain_data = self.hass.data[DOMAIN]
+        cache = domain_data["state_cache"]
+        for entity in domain_data["entities"].values():
+            if entity._state_dirty:
+                cache[entity._entry_id] = entity._serialize_runtime_state()
+                entity._state_dirty = False
+        return cache
+
+    async def _async_persist_runtime_state(self) -> None:
+        """Persist runtime state immediately, flushing any pending delayed save."""
         if not self._state_store or not self._state_dirty:
             return
-
-        cache = self._state_cache_ref
-        if cache is None:
-            cache = {}
-            self._state_cache_ref = cache
-
-        cache[self._entry_id] = self._serialize_runtime_state()
-        await self._state_store.async_save(cache)
-        self._state_dirty = False
+        await self._state_store.async_save(self._collect_runtime_state())
 
     async def _async_load_runtime_state(self) -> None:
         """Load runtime state after restart."""
@@ -1848,10 +2051,11 @@ class AdaptiveThermostat(ClimateEntity):
             return
 
         cache = self._state_cache_ref
-        if cache is None or not cache:
+        if not cache:
+            # Fill the shared cache in place so every zone saves into the same dict
             stored = await self._state_store.async_load()
-            cache = stored or {}
-            self._state_cache_ref = cache
+            if stored:
+                cache.update(stored)
 
         data = cache.get(self._entry_id)
         if not data:
@@ -1902,14 +2106,149 @@ class AdaptiveThermostat(ClimateEntity):
             manual_override,
         )
 
-    async def _async_control_tick(self, _now: datetime) -> None:
+    @callback
+    def _async_control_tick(self, _now: datetime) -> None:
         """Periodic control tick to ensure regular evaluation."""
-        self.async_schedule_update_ha_state(True)
+        self.hass.async_create_task(self._async_update_and_write(), eager_start=True)
 
     @callback
     def _async_state_changed(self, event: Event) -> None:
-        """Handle tracked entity state changes."""
-        self.async_schedule_update_ha_state(True)
+        """Dispatch a tracked entity state change to its handler."""
+        data = event.data
+        old_state = data.get("old_state")
+        new_state = data.get("new_state")
+        if (
+            old_state is not None
+            and new_state is not None
+            and old_state.state == new_state.state
+        ):
+            # Attribute-only update (battery, linkquality, ...): every handler
+            # reads only the state value, so there is nothing to apply.
+            return
+        handler = self._entity_handlers.get(data["entity_id"])
+        if handler is not None:
+            handler(event)
+
+    @callback
+    def _async_humidity_changed(self, event: Event) -> None:
+        """Apply a humidity reading without running a control pass."""
+        humidity = self._humidity_from_state(event.data.get("new_state"))
+        if humidity is None:
+            return
+        self._current_humidity = humidity
+        self._attr_extra_state_attributes["current_humidity"] = humidity
+        self._async_schedule_write()
+
+    @callback
+    def _async_motion_changed(self, event: Event) -> None:
+        """Apply a motion reading without running a control pass."""
+        self._attr_extra_state_attributes["motion_active"] = self._binary_from_state(
+            event.data.get("new_state")
+        )
+        self._async_schedule_write()
+
+    @callback
+    def _async_request_update(self, _event: Event) -> None:
+        """Schedule a debounced control pass."""
+        if self._update_in_progress:
+            self._update_rerun = True
+            return
+        self.hass.async_create_task(self._update_debouncer.async_call(), eager_start=True)
+
+    async def _async_update_and_write(self) -> None:
+        """Run a control pass and publish the state only if it changed.
+
+        Passes can wait up to VALVE_OPEN_TIMEOUT_SECONDS for valves; a trigger
+        received meanwhile runs one more pass right after, instead of waiting
+        for the next control tick.
+        """
+        if self._update_in_progress:
+            self._update_rerun = True
+            return
+        self._update_in_progress = True
+        try:
+            while True:
+                self._update_rerun = False
+                await self.async_device_update()
+                self._async_write_ha_state_if_changed()
+                if not self._update_rerun:
+                    return
+        finally:
+            self._update_in_progress = False
+
+    def _state_snapshot(self) -> Tuple[Any, ...]:
+        """Return the observable state, ignoring the per-tick timestamp."""
+        attributes = {
+            key: value
+            for key, value in self._attr_extra_state_attributes.items()
+            if key != "last_updated"
+        }
+        return (
+            self._hvac_mode,
+            self.hvac_action,
+            self._current_temperature,
+            self._target_temperature,
+            self._current_humidity,
+            self._current_preset,
+            attributes,
+        )
+
+    @callback
+    def async_write_ha_state(self) -> None:
+        """Write the state and remember what was published."""
+        self._last_written_snapshot = self._state_snapshot()
+        super().async_write_ha_state()
+        self._async_publish_heater_state()
+
+    @callback
+    def _async_write_ha_state_if_changed(self) -> None:
+        """Write the state unless it matches the last published one."""
+        snapshot = self._state_snapshot()
+        if snapshot == self._last_written_snapshot:
+            return
+        self._last_written_snapshot = snapshot
+        super().async_write_ha_state()
+        self._async_publish_heater_state()
+
+    @callback
+    def _async_publish_heater_state(self) -> None:
+        """Notify the heater binary sensor when the zone heater state changes."""
+        payload = (self._hvac_mode, self.hvac_action, self._zone_heater_on)
+        if payload == self._last_heater_signal:
+            return
+        self._last_heater_signal = payload
+        async_dispatcher_send(self.hass, f"{SIGNAL_HEATER_STATE}_{self._entry_id}", *payload)
+
+    @callback
+    def _async_heater_changed(self, event: Event) -> None:
+        """Refresh heater diagnostics when a zone valve changes state."""
+        data = event.data
+        old_state = data.get("old_state")
+        new_state = data.get("new_state")
+        if (
+            old_state is not None
+            and new_state is not None
+            and old_state.state == new_state.state
+            and old_state.attributes.get("friendly_name") == new_state.attributes.get("friendly_name")
+        ):
+            # Nothing shown in heater_states changed (e.g. a valve position report)
+            return
+        self._attr_extra_state_attributes["heater_states"] = self._gather_heater_states()
+        self._async_schedule_write()
+
+    @callback
+    def _async_schedule_write(self) -> None:
+        """Coalesce diagnostic writes raised in one loop iteration."""
+        if self._write_scheduled:
+            return
+        self._write_scheduled = True
+        self.hass.loop.call_soon(self._async_flush_write)
+
+    @callback
+    def _async_flush_write(self) -> None:
+        """Publish the state queued by _async_schedule_write."""
+        self._write_scheduled = False
+        self._async_write_ha_state_if_changed()
 
     def reset_manual_override(self) -> None:
         """Clear manual override so auto on/off can resume control."""
@@ -1920,12 +2259,12 @@ class AdaptiveThermostat(ClimateEntity):
 
     def dismiss_window_alert(self) -> None:
         """Clear a window alert when the user confirms it as a false alarm."""
-        now_ts = dt_util.utcnow().timestamp()
-        if self._open_window_detected or self._window_candidate:
+        now_ts = time.time()
+        if self._open_window_detected or self._window_candidate.active:
             self._open_window_detected = False
             self._window_alert = None
             self._last_window_event_ts = now_ts
-            self._window_candidate = None
+            self._window_candidate.active = False
             self._handle_window_state_transition(
                 now_ts,
                 False,
@@ -1937,6 +2276,6 @@ class AdaptiveThermostat(ClimateEntity):
         self._attr_extra_state_attributes["window_alert"] = None
         self._attr_extra_state_attributes["window_candidate_active"] = False
         if self._hvac_mode == HVACMode.HEAT:
-            self.hass.async_create_task(self._async_control_heating(now_ts))
+            self.hass.async_create_task(self._async_control_heating(now_ts), eager_start=True)
         self._mark_state_dirty()
         self.async_write_ha_state()
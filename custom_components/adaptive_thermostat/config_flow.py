@@ -44,6 +44,14 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Selectors are stateless, so fields with identical configs share one instance
+TEMPERATURE_SENSOR_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(domain=["sensor"], device_class="temperature")
+)
+PRESET_TEMPERATURE_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=10, max=30, step=0.1, mode="box")
+)
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_NAME): str,
@@ -58,15 +66,9 @@ STEP_ZONE_DATA_SCHEMA = vol.Schema(
         vol.Optional(CONF_CENTRAL_HEATER): selector.EntitySelector(
             selector.EntitySelectorConfig(domain=["switch", "input_boolean", "climate"])
         ),
-        vol.Required(CONF_TEMP_SENSOR): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain=["sensor"], device_class="temperature")
-        ),
-        vol.Required(CONF_OUTDOOR_SENSOR): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain=["sensor"], device_class="temperature")
-        ),
-        vol.Optional(CONF_BACKUP_OUTDOOR_SENSOR): selector.EntitySelector(
-            selector.EntitySelectorConfig(domain=["sensor"], device_class="temperature", multiple=False)
-        ),
+        vol.Required(CONF_TEMP_SENSOR): TEMPERATURE_SENSOR_SELECTOR,
+        vol.Required(CONF_OUTDOOR_SENSOR): TEMPERATURE_SENSOR_SELECTOR,
+        vol.Optional(CONF_BACKUP_OUTDOOR_SENSOR): TEMPERATURE_SENSOR_SELECTOR,
         vol.Optional(CONF_HUMIDITY_SENSOR): selector.EntitySelector(
             selector.EntitySelectorConfig(domain=["sensor"], device_class="humidity", multiple=False)
         ),
@@ -116,18 +118,38 @@ STEP_ADAPTIVE_SCHEMA = vol.Schema(
 
 STEP_PRESETS_SCHEMA = vol.Schema(
     {
-        vol.Required(CONF_HOME_PRESET, default=DEFAULT_HOME_PRESET): selector.NumberSelector(
-            selector.NumberSelectorConfig(min=10, max=30, step=0.1, mode="box")
-        ),
-        vol.Required(CONF_SLEEP_PRESET, default=DEFAULT_SLEEP_PRESET): selector.NumberSelector(
-            selector.NumberSelectorConfig(min=10, max=30, step=0.1, mode="box")
-        ),
-        vol.Required(CONF_AWAY_PRESET, default=DEFAULT_AWAY_PRESET): selector.NumberSelector(
-            selector.NumberSelectorConfig(min=10, max=30, step=0.1, mode="box")
-        ),
+        vol.Required(CONF_HOME_PRESET, default=DEFAULT_HOME_PRESET): PRESET_TEMPERATURE_SELECTOR,
+        vol.Required(CONF_SLEEP_PRESET, default=DEFAULT_SLEEP_PRESET): PRESET_TEMPERATURE_SELECTOR,
+        vol.Required(CONF_AWAY_PRESET, default=DEFAULT_AWAY_PRESET): PRESET_TEMPERATURE_SELECTOR,
     }
 )
 
+def _schema_fields(schema: vol.Schema) -> tuple:
+    """Resolve (key, default, validator) triples of a static step schema once."""
+    fields = []
+    for key_obj, validator in schema.schema.items():
+        key_str = key_obj.schema if isinstance(key_obj, vol.Marker) else key_obj
+        default = vol.UNDEFINED
+        if isinstance(key_obj, vol.Marker) and key_obj.default is not vol.UNDEFINED:
+            default = key_obj.default() if callable(key_obj.default) else key_obj.default
+        fields.append((key_str, default, validator))
+    return tuple(fields)
+
+STEP_TIMING_FIELDS = _schema_fields(STEP_TIMING_SCHEMA)
+STEP_AUTO_ONOFF_FIELDS = _schema_fields(STEP_AUTO_ONOFF_SCHEMA)
+STEP_ADAPTIVE_FIELDS = _schema_fields(STEP_ADAPTIVE_SCHEMA)
+STEP_PRESETS_FIELDS = _schema_fields(STEP_PRESETS_SCHEMA)
+
+def _prefilled_schema(fields: tuple, current_data: Dict[str, Any]) -> vol.Schema:
+    """Build a step schema pre-filled with current values or schema defaults."""
+    schema_dict = {}
+    for key_str, default, validator in fields:
+        current_value = current_data.get(key_str)
+        if current_value is None and default is not vol.UNDEFINED:
+            current_value = default
+        schema_dict[vol.Required(key_str, default=current_value)] = validator
+    return vol.Schema(schema_dict)
+
 def _validate_input(user_input: dict, schema: vol.Schema) -> dict:
     """Validate user input against schema, clean up empty optional fields."""
     validated_input = schema(user_input)
@@ -437,21 +459,11 @@ class AdaptiveThermostatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
 
         # Pre-populate form with current values or defaults
-        current_data = config_entry.data
-        schema_dict = {}
-        for key_obj, selector_config in STEP_TIMING_SCHEMA.schema.items():
-            key_str = key_obj.schema if isinstance(key_obj, vol.Marker) else key_obj
-            current_value = current_data.get(key_str)
-            
-            # Use current value or fall back to schema default
-            if current_value is None and hasattr(key_obj, 'default') and key_obj.default is not vol.UNDEFINED:
-                current_value = key_obj.default() if callable(key_obj.default) else key_obj.default
-            
-            schema_dict[vol.Required(key_str, default=current_value)] = selector_config
-        
+        schema = _prefilled_schema(STEP_TIMING_FIELDS, config_entry.data)
+
         return self.async_show_form(
             step_id="reconfigure_timing_setup",
-            data_schema=vol.Schema(schema_dict),
+            data_schema=schema,
             errors=errors,
         )
 
@@ -475,21 +487,11 @@ class AdaptiveThermostatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
 
         # Pre-populate form with current values or defaults
-        current_data = config_entry.data
-        schema_dict = {}
-        for key_obj, selector_config in STEP_AUTO_ONOFF_SCHEMA.schema.items():
-            key_str = key_obj.schema if isinstance(key_obj, vol.Marker) else key_obj
-            current_value = current_data.get(key_str)
-            
-            # Use current value or fall back to schema default
-            if current_value is None and hasattr(key_obj, 'default') and key_obj.default is not vol.UNDEFINED:
-                current_value = key_obj.default() if callable(key_obj.default) else key_obj.default
-            
-            schema_dict[vol.Required(key_str, default=current_value)] = selector_config
-        
+        schema = _prefilled_schema(STEP_AUTO_ONOFF_FIELDS, config_entry.data)
+
         return self.async_show_form(
             step_id="reconfigure_auto_onoff_setup",
-            data_schema=vol.Schema(schema_dict),
+            data_schema=schema,
             errors=errors,
         )
 
@@ -512,20 +514,12 @@ class AdaptiveThermostatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 _LOGGER.exception("Unexpected exception in reconfigure adaptive setup")
                 errors["base"] = "unknown"
 
-        current_data = config_entry.data
-        schema_dict = {}
-        for key_obj, selector_config in STEP_ADAPTIVE_SCHEMA.schema.items():
-            key_str = key_obj.schema if isinstance(key_obj, vol.Marker) else key_obj
-            current_value = current_data.get(key_str)
-
-            if current_value is None and hasattr(key_obj, "default") and key_obj.default is not vol.UNDEFINED:
-                current_value = key_obj.default() if callable(key_obj.default) else key_obj.default
-
-            schema_dict[vol.Required(key_str, default=current_value)] = selector_config
+        # Pre-populate form with current values or defaults
+        schema = _prefilled_schema(STEP_ADAPTIVE_FIELDS, config_entry.data)
 
         return self.async_show_form(
             step_id="reconfigure_adaptive_setup",
-            data_schema=vol.Schema(schema_dict),
+            data_schema=schema,
             errors=errors,
         )
 
@@ -539,11 +533,13 @@ class AdaptiveThermostatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 validated_input = _validate_input(user_input, STEP_PRESETS_SCHEMA)
                 self._config_data.update(validated_input)
                 
-                # Complete reconfiguration
-                return self.async_update_reload_and_abort(
+                # Complete reconfiguration. The entry's update listener
+                # reloads it, so update without scheduling a second reload.
+                self.hass.config_entries.async_update_entry(
                     config_entry,
-                    data_updates=self._config_data,
+                    data={**config_entry.data, **self._config_data},
                 )
+                return self.async_abort(reason="reconfigure_successful")
             except vol.MultipleInvalid as e:
                 _LOGGER.error(f"Validation error in reconfigure presets setup: {e}")
                 for error in e.errors:
@@ -554,20 +550,10 @@ class AdaptiveThermostatConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
 
         # Pre-populate form with current values or defaults
-        current_data = config_entry.data
-        schema_dict = {}
-        for key_obj, selector_config in STEP_PRESETS_SCHEMA.schema.items():
-            key_str = key_obj.schema if isinstance(key_obj, vol.Marker) else key_obj
-            current_value = current_data.get(key_str)
-            
-            # Use current value or fall back to schema default
-            if current_value is None and hasattr(key_obj, 'default') and key_obj.default is not vol.UNDEFINED:
-                current_value = key_obj.default() if callable(key_obj.default) else key_obj.default
-            
-            schema_dict[vol.Required(key_str, default=current_value)] = selector_config
-        
+        schema = _prefilled_schema(STEP_PRESETS_FIELDS, config_entry.data)
+
         return self.async_show_form(
             step_id="reconfigure_presets_setup",
-            data_schema=vol.Schema(schema_dict),
+            data_schema=schema,
             errors=errors,
         )
@@ -55,3 +55,4 @@ STORAGE_STATE_KEY = "adaptive_thermostat_runtime_state"
 
 # Dispatcher signals
 SIGNAL_THERMOSTAT_READY = "adaptive_thermostat_thermostat_ready"
+SIGNAL_HEATER_STATE = "adaptive_thermostat_heater_state"
@@ -52,10 +52,10 @@ class _AdaptiveThermostatLinkedSensor(SensorEntity):
         unit: str,
         device_class: Optional[SensorDeviceClass] = None,
     ) -> None:
-        self._hass = hass
         self._entry = entry
         self._climate_entity_id: Optional[str] = None
-        self._unsub_dispatcher: Optional[Callable[[], None]] = None
+        # Created by async_setup before any entry is set up
+        self._entry_map: dict[str, str] = hass.data[DOMAIN]["entry_to_entity_id"]
         self._unsub_state: Optional[Callable[[], None]] = None
         base_name = entry.title or entry.data.get(CONF_NAME) or "Adaptive Thermostat"
         self._attr_unique_id = f"{entry.entry_id}_{unique_suffix}"
@@ -76,16 +76,15 @@ class _AdaptiveThermostatLinkedSensor(SensorEntity):
         """Run when the sensor is added to Home Assistant."""
         await super().async_added_to_hass()
         signal = f"{SIGNAL_THERMOSTAT_READY}_{self._entry.entry_id}"
-        self._unsub_dispatcher = async_dispatcher_connect(
-            self.hass, signal, self._handle_thermostat_ready
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, signal, self._handle_thermostat_ready
+            )
         )
         self._try_bind_existing_thermostat()
 
     async def async_will_remove_from_hass(self) -> None:
         """Cleanup when the sensor is removed."""
-        if self._unsub_dispatcher:
-            self._unsub_dispatcher()
-            self._unsub_dispatcher = None
         if self._unsub_state:
             self._unsub_state()
             self._unsub_state = None
@@ -93,9 +92,7 @@ class _AdaptiveThermostatLinkedSensor(SensorEntity):
 
     def _try_bind_existing_thermostat(self) -> None:
         """Attempt to bind immediately if climate entity already registered."""
-        domain_data = self.hass.data.get(DOMAIN, {})
-        entry_map = domain_data.get("entry_to_entity_id") or {}
-        entity_id = entry_map.get(self._entry.entry_id)
+        entity_id = self._entry_map.get(self._entry.entry_id)
         if entity_id:
             self._set_climate_entity(entity_id)
 
@@ -147,8 +144,8 @@ class _AdaptiveThermostatLinkedSensor(SensorEntity):
     def _handle_climate_state_event(self, event: Event) -> None:
         """Handle a state change from the linked climate entity."""
         new_state = event.data.get("new_state")
-        self._update_from_state(new_state)
-        self.async_write_ha_state()
+        if self._update_from_state(new_state):
+            self.async_write_ha_state()
 
     def _extract_value(self, attrs: dict[str, Any]) -> Optional[float]:
         """Extract native value from thermostat attributes."""
@@ -162,22 +159,34 @@ class _AdaptiveThermostatLinkedSensor(SensorEntity):
     ) -> dict[str, Any]:
         """Return additional state attributes for the sensor."""
         return {
-            "linked_entity_id": getattr(state, "entity_id", None),
+            "linked_entity_id": state.entity_id,
         }
 
-    def _update_from_state(self, state: Optional[Any]) -> None:
-        """Update the sensor from a Home Assistant state object."""
+    def _update_from_state(self, state: Optional[Any]) -> bool:
+        """Update the sensor from a Home Assistant state object.
+
+        Returns True when the availability, value or attributes changed.
+        """
+        previous = (
+            self._attr_available,
+            self._attr_native_value,
+            self._attr_extra_state_attributes,
+        )
         if state is None:
             self._attr_available = False
             self._attr_native_value = None
             self._attr_extra_state_attributes = {}
-            return
-
-        self._attr_available = True
-        attrs = state.attributes or {}
-        raw_value = self._extract_value(attrs)
-        self._attr_native_value = round(raw_value, 3) if raw_value is not None else None
-        self._attr_extra_state_attributes = self._build_extra_attrs(attrs, raw_value, state)
+        else:
+            self._attr_available = True
+            attrs = state.attributes or {}
+            raw_value = self._extract_value(attrs)
+            self._attr_native_value = round(raw_value, 3) if raw_value is not None else None
+            self._attr_extra_state_attributes = self._build_extra_attrs(attrs, raw_value, state)
+        return previous != (
+            self._attr_available,
+            self._attr_native_value,
+            self._attr_extra_state_attributes,
+        )
 
 
 class AdaptiveThermostatSlopeSensor(_AdaptiveThermostatLinkedSensor):
@@ -7,7 +7,7 @@ from typing import Dict, List, Optional, Tuple
 import math
 
 
-@dataclass
+@dataclass(slots=True)
 class Params:
     """Model parameters for the thermal controller."""
 
@@ -25,6 +25,21 @@ def _clip(value: float, low: float, high: float) -> float:
 class ThermalController:
     """Grey-box radiator + room controller with peak-hitting and hold modes."""
 
+    __slots__ = (
+        "target",
+        "deadband",
+        "window_s",
+        "min_on_s",
+        "min_off_s",
+        "learn_rate",
+        "params",
+        "_ema_outdoor",
+        "_ema_alpha",
+        "_ref_outdoor",
+        "_last_good_on",
+        "_min_on_override_s",
+    )
+
     def __init__(
         self,
         target: float,
@@ -63,7 +78,7 @@ class ThermalController:
         """Compute exponential moving average alpha."""
         if halflife_s <= 0:
             return 1.0
-        return 1.0 - math.exp(-math.log(2) * dt_s / halflife_s)
+        return -math.expm1(-math.log(2) * dt_s / halflife_s)
 
     def update_outdoor(self, temp_out: float) -> None:
         """Feed a new outdoor temperature sample."""
@@ -179,7 +194,7 @@ class ThermalController:
         params = self.params
         tau_r, tau_th, p_exp = params.tau_r, params.tau_th, params.p
 
-        E_cut = 1.0 - math.exp(-tau_on / max(1e-6, tau_r))
+        E_cut = -math.expm1(-tau_on / max(1e-6, tau_r))
         t_peak = self._t_peak()
         denom = tau_th - tau_r
         if denom == 0:
@@ -339,7 +354,7 @@ class ThermalController:
 
         def g_tail_peak(tau_value: float) -> float:
             tau_r_local, tau_th_local, p_local = tau_r, tau_th, old.p
-            E_cut_local = 1.0 - math.exp(-tau_value / max(1e-6, tau_r_local))
+            E_cut_local = -math.expm1(-tau_value / max(1e-6, tau_r_local))
             tpk_local = (tau_r_local * tau_th_local / (tau_th_local - tau_r_local)) * math.log(
                 tau_th_local / tau_r_local
             )